@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional, Union, Type
 import logging
 
 from .fields import SimpleField
+from .keywords import JSON_SCHEMA_FORMATS
 
 # Optional pydantic import
 try:
@@ -29,7 +30,10 @@ def simple_schema(fields: Dict[str, Union[str, SimpleField]]) -> Dict[str, Any]:
     
     for field_name, field_def in fields.items():
         if isinstance(field_def, str):
-            field_def = SimpleField(field_def)
+            # A bare type name always maps to a required {"type": ...}
+            properties[field_name] = {"type": field_def}
+            required.append(field_name)
+            continue
         
         prop_schema = _simple_field_to_json_schema(field_def)
         properties[field_name] = prop_schema
@@ -51,13 +55,7 @@ def _simple_field_to_json_schema(field: SimpleField) -> Dict[str, Any]:
     """Convert SimpleField to JSON Schema property with enhanced features"""
     # Handle union types first
     if field.union_types and len(field.union_types) > 1:
-        union_schemas = []
-        for union_type in field.union_types:
-            if union_type == "null":
-                union_schemas.append({"type": "null"})
-            else:
-                union_schemas.append({"type": union_type})
-        prop = {"anyOf": union_schemas}
+        prop = {"anyOf": [{"type": union_type} for union_type in field.union_types]}
         
         # Add description to the union
         if field.description:
@@ -75,21 +73,13 @@ def _simple_field_to_json_schema(field: SimpleField) -> Dict[str, Any]:
     
     # Handle enum/choices
     if field.choices:
-        prop["enum"] = field.choices
+        prop["enum"] = list(field.choices)
     
     # Add format hints for special types
-    if field.format_hint:
-        if field.format_hint == "email":
-            prop["format"] = "email"
-        elif field.format_hint in ["url", "uri"]:
-            prop["format"] = "uri"
-        elif field.format_hint == "datetime":
-            prop["format"] = "date-time"
-        elif field.format_hint == "date":
-            prop["format"] = "date"
-        elif field.format_hint == "uuid":
-            prop["format"] = "uuid"
-        # Note: phone doesn't have a standard JSON Schema format
+    # Note: phone doesn't have a standard JSON Schema format
+    fmt = JSON_SCHEMA_FORMATS.get(field.format_hint)
+    if fmt:
+        prop["format"] = fmt
     
     # Numeric constraints
     if field.field_type in ["integer", "number"]:
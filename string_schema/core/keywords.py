@@ -0,0 +1,23 @@
+"""
+JSON Schema keyword tables for Simple Schema
+
+Shared mappings between SimpleField attributes and JSON Schema keywords.
+"""
+
+# Format hints and their JSON Schema "format" values
+JSON_SCHEMA_FORMATS = {
+    'email': 'email',
+    'url': 'uri',
+    'uri': 'uri',
+    'datetime': 'date-time',
+    'date': 'date',
+    'uuid': 'uuid'
+}
+
+# SimpleField constraint attributes and the JSON Schema keywords they map to
+FIELD_CONSTRAINT_KEYWORDS = (
+    ('min_val', 'minimum'),
+    ('max_val', 'maximum'),
+    ('min_length', 'minLength'),
+    ('max_length', 'maxLength')
+)
@@ -4,13 +4,16 @@ Validation utilities for Simple Schema
 Contains functions for validating schemas and field definitions.
 """
 
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 import logging
 
 from .fields import SimpleField
 
 logger = logging.getLogger(__name__)
 
+_VALID_FORMATS = frozenset({'email', 'uri', 'date-time', 'date', 'uuid'})
+_NUMERIC_LENGTH_KEYWORDS = frozenset({'minimum', 'maximum', 'minLength', 'maxLength', 'minItems', 'maxItems'})
+
 
 def validate_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -26,6 +29,11 @@ def validate_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
         - warnings: List of warning messages
         - field_count: Number of fields in the schema
     """
+    return _validate_schema(schema)
+
+
+def _validate_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a JSON schema and build the result dictionary"""
     result = {
         'valid': True,
         'errors': [],
@@ -86,17 +94,15 @@ def _validate_object_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
     
     result['field_count'] = len(properties)
     
-    # Validate each property
+    # Validate each property, collecting straight into this result
     for field_name, field_schema in properties.items():
-        field_result = _validate_field_schema(field_name, field_schema)
-        result['errors'].extend(field_result['errors'])
-        result['warnings'].extend(field_result['warnings'])
-        result['features_used'].extend(field_result['features_used'])
+        _validate_field_schema(field_name, field_schema, result)
     
     # Validate required fields
-    for req_field in required:
-        if req_field not in properties:
-            result['errors'].append(f"Required field '{req_field}' not found in properties")
+    result['errors'].extend(
+        f"Required field '{req_field}' not found in properties"
+        for req_field in required if req_field not in properties
+    )
     
     # Remove duplicate features
     result['features_used'] = list(set(result['features_used']))
@@ -134,21 +140,20 @@ def _validate_array_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
         result['features_used'].extend(items_result['features_used'])
     else:
         # Simple array items
-        field_result = _validate_field_schema('array_item', items)
-        result['errors'].extend(field_result['errors'])
-        result['warnings'].extend(field_result['warnings'])
-        result['features_used'].extend(field_result['features_used'])
+        _validate_field_schema('array_item', items, result)
     
     return result
 
 
-def _validate_field_schema(field_name: str, field_schema: Dict[str, Any]) -> Dict[str, Any]:
-    """Validate individual field schema"""
-    result = {
-        'features_used': [],
-        'errors': [],
-        'warnings': []
-    }
+def _validate_field_schema(field_name: str, field_schema: Dict[str, Any],
+                           result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Validate individual field schema, appending to ``result`` when given"""
+    if result is None:
+        result = {
+            'features_used': [],
+            'errors': [],
+            'warnings': []
+        }
     
     # Check for union types
     if 'anyOf' in field_schema:
@@ -169,13 +174,11 @@ def _validate_field_schema(field_name: str, field_schema: Dict[str, Any]) -> Dic
     if 'format' in field_schema:
         result['features_used'].append('special_types')
         format_value = field_schema['format']
-        valid_formats = ['email', 'uri', 'date-time', 'date', 'uuid']
-        if format_value not in valid_formats:
+        if format_value not in _VALID_FORMATS:
             result['warnings'].append(f"Field '{field_name}' uses non-standard format: {format_value}")
     
     # Check for constraints
-    constraint_fields = ['minimum', 'maximum', 'minLength', 'maxLength', 'minItems', 'maxItems']
-    if any(field in field_schema for field in constraint_fields):
+    if not _NUMERIC_LENGTH_KEYWORDS.isdisjoint(field_schema):
         result['features_used'].append('constraints')
     
     # Validate constraint values
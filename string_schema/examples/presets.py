@@ -9,6 +9,7 @@ import logging
 
 from ..core.fields import SimpleField
 from ..core.builders import simple_schema, list_of_objects_schema
+from ..core.keywords import FIELD_CONSTRAINT_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
@@ -144,22 +145,19 @@ def user_list_schema(**kwargs) -> Dict[str, Any]:
     user_fields = {}
     user_base = user_schema(**kwargs)
     
+    required_fields = set(user_base.get('required', []))
+    
     # Convert properties to SimpleField definitions
     for field_name, field_schema in user_base['properties'].items():
         field_type = field_schema['type']
-        required = field_name in user_base.get('required', [])
+        required = field_name in required_fields
         
         simple_field = SimpleField(field_type, required=required)
         
         # Copy constraints
-        if 'minimum' in field_schema:
-            simple_field.min_val = field_schema['minimum']
-        if 'maximum' in field_schema:
-            simple_field.max_val = field_schema['maximum']
-        if 'minLength' in field_schema:
-            simple_field.min_length = field_schema['minLength']
-        if 'maxLength' in field_schema:
-            simple_field.max_length = field_schema['maxLength']
+        for attr, key in FIELD_CONSTRAINT_KEYWORDS:
+            if key in field_schema:
+                setattr(simple_field, attr, field_schema[key])
         if 'enum' in field_schema:
             simple_field.choices = field_schema['enum']
         if 'format' in field_schema:
@@ -194,22 +192,19 @@ def _convert_object_to_list_schema(object_schema: Dict[str, Any], description: s
     """Helper function to convert object schema to list schema"""
     fields = {}
     
+    required_fields = set(object_schema.get('required', []))
+    
     # Convert properties to SimpleField definitions
     for field_name, field_schema in object_schema['properties'].items():
         field_type = field_schema['type']
-        required = field_name in object_schema.get('required', [])
+        required = field_name in required_fields
         
         simple_field = SimpleField(field_type, required=required)
         
         # Copy constraints
-        if 'minimum' in field_schema:
-            simple_field.min_val = field_schema['minimum']
-        if 'maximum' in field_schema:
-            simple_field.max_val = field_schema['maximum']
-        if 'minLength' in field_schema:
-            simple_field.min_length = field_schema['minLength']
-        if 'maxLength' in field_schema:
-            simple_field.max_length = field_schema['maxLength']
+        for attr, key in FIELD_CONSTRAINT_KEYWORDS:
+            if key in field_schema:
+                setattr(simple_field, attr, field_schema[key])
         if 'enum' in field_schema:
             simple_field.choices = field_schema['enum']
         if 'format' in field_schema:
@@ -103,7 +103,7 @@ def validate_json_schema_compliance(schema: Dict[str, Any]) -> Dict[str, Any]:
     # Check for non-standard extensions
     non_standard_fields = []
     for key in schema.keys():
-        if key.startswith('x-') or key not in _get_standard_json_schema_fields():
+        if key.startswith('x-') or key not in _STANDARD_JSON_SCHEMA_FIELDS:
             non_standard_fields.append(key)
     
     if non_standard_fields:
@@ -152,15 +152,18 @@ def _validate_array_schema_compliance(schema: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+_STANDARD_JSON_SCHEMA_FIELDS = frozenset({
+    '$schema', '$id', '$ref', '$defs', 'title', 'description', 'type', 'properties',
+    'required', 'additionalProperties', 'items', 'minItems', 'maxItems', 'uniqueItems',
+    'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum', 'multipleOf',
+    'minLength', 'maxLength', 'pattern', 'format', 'enum', 'const', 'anyOf', 'oneOf',
+    'allOf', 'not', 'if', 'then', 'else', 'examples', 'default', 'readOnly', 'writeOnly'
+})
+
+
 def _get_standard_json_schema_fields() -> set:
     """Get set of standard JSON Schema fields"""
-    return {
-        '$schema', '$id', '$ref', '$defs', 'title', 'description', 'type', 'properties',
-        'required', 'additionalProperties', 'items', 'minItems', 'maxItems', 'uniqueItems',
-        'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum', 'multipleOf',
-        'minLength', 'maxLength', 'pattern', 'format', 'enum', 'const', 'anyOf', 'oneOf',
-        'allOf', 'not', 'if', 'then', 'else', 'examples', 'default', 'readOnly', 'writeOnly'
-    }
+    return set(_STANDARD_JSON_SCHEMA_FIELDS)
 
 
 def optimize_json_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -173,31 +176,46 @@ def optimize_json_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Optimized JSON Schema
     """
-    optimized = schema.copy()
-    
-    # Remove empty arrays and objects
-    optimized = _remove_empty_values(optimized)
+    # Remove empty arrays and objects and order fields in one walk that
+    # builds a new tree, leaving the input untouched
+    optimized = _clean_and_order(schema, isinstance(schema, dict))
     
     # Consolidate similar constraints
     optimized = _consolidate_constraints(optimized)
     
-    # Order fields for better readability
-    optimized = _order_schema_fields(optimized)
-    
     return optimized
 
 
-def _remove_empty_values(obj: Any) -> Any:
-    """Remove empty arrays and objects from schema"""
+# Preferred field order for readability; other fields follow in their original order
+_FIELD_ORDER = (
+    '$schema', '$id', 'title', 'description', 'type', 'properties', 'required',
+    'items', 'minItems', 'maxItems', 'minimum', 'maximum', 'minLength', 'maxLength',
+    'format', 'enum', 'anyOf', 'oneOf', 'allOf', 'examples', 'default',
+    'additionalProperties'
+)
+_FIELD_RANK = {field: rank for rank, field in enumerate(_FIELD_ORDER)}
+
+
+def _field_rank(field: str) -> int:
+    return _FIELD_RANK.get(field, len(_FIELD_ORDER))
+
+
+def _clean_and_order(obj: Any, order: bool = True) -> Any:
+    """
+    Remove empty arrays and objects from schema and order its fields.
+
+    Lists nested directly in lists are cleaned but not reordered.
+    """
     if isinstance(obj, dict):
         result = {}
-        for key, value in obj.items():
-            cleaned_value = _remove_empty_values(value)
+        for key in (sorted(obj, key=_field_rank) if order else obj):
+            cleaned_value = _clean_and_order(obj[key], order)
             if cleaned_value is not None and cleaned_value != [] and cleaned_value != {}:
                 result[key] = cleaned_value
         return result
     elif isinstance(obj, list):
-        return [_remove_empty_values(item) for item in obj if item is not None]
+        return [_clean_and_order(item, order and not isinstance(item, list))
+                for item in obj if item is not None]
     else:
         return obj
 
@@ -208,45 +226,6 @@ def _consolidate_constraints(schema: Dict[str, Any]) -> Dict[str, Any]:
     return schema
 
 
-def _order_schema_fields(schema: Dict[str, Any]) -> Dict[str, Any]:
-    """Order schema fields for better readability"""
-    if not isinstance(schema, dict):
-        return schema
-    
-    # Define preferred field order
-    field_order = [
-        '$schema', '$id', 'title', 'description', 'type', 'properties', 'required',
-        'items', 'minItems', 'maxItems', 'minimum', 'maximum', 'minLength', 'maxLength',
-        'format', 'enum', 'anyOf', 'oneOf', 'allOf', 'examples', 'default',
-        'additionalProperties'
-    ]
-    
-    ordered = {}
-    
-    # Add fields in preferred order
-    for field in field_order:
-        if field in schema:
-            value = schema[field]
-            if isinstance(value, dict):
-                ordered[field] = _order_schema_fields(value)
-            elif isinstance(value, list):
-                ordered[field] = [_order_schema_fields(item) if isinstance(item, dict) else item for item in value]
-            else:
-                ordered[field] = value
-    
-    # Add any remaining fields
-    for field, value in schema.items():
-        if field not in ordered:
-            if isinstance(value, dict):
-                ordered[field] = _order_schema_fields(value)
-            elif isinstance(value, list):
-                ordered[field] = [_order_schema_fields(item) if isinstance(item, dict) else item for item in value]
-            else:
-                ordered[field] = value
-    
-    return ordered
-
-
 # Clear function name alias
 def json_schema_to_openapi(json_schema: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -284,28 +263,36 @@ def json_schema_to_string(json_schema: Dict[str, Any]) -> str:
     return _json_schema_to_string(json_schema)
 
 
-def convert_to_openapi_schema(json_schema: Dict[str, Any]) -> Dict[str, Any]:
+# JSON Schema fields that aren't supported in OpenAPI
+_JSON_SCHEMA_ONLY_FIELDS = frozenset({'$schema', '$id'})
+
+
+def convert_to_openapi_schema(json_schema: Dict[str, Any], copy: bool = True) -> Dict[str, Any]:
     """
     Convert JSON Schema to OpenAPI 3.0 schema format.
     
     Args:
         json_schema: Standard JSON Schema
+        copy: If False, convert json_schema in place instead of building a new
+            top-level dict (for callers that own a freshly built schema)
         
     Returns:
         OpenAPI compatible schema
     """
-    openapi_schema = json_schema.copy()
-    
     # Remove JSON Schema specific fields that aren't supported in OpenAPI
-    fields_to_remove = ['$schema', '$id']
-    for field in fields_to_remove:
-        openapi_schema.pop(field, None)
+    if copy:
+        openapi_schema = {k: v for k, v in json_schema.items() if k not in _JSON_SCHEMA_ONLY_FIELDS}
+    else:
+        openapi_schema = json_schema
+        for key in _JSON_SCHEMA_ONLY_FIELDS:
+            openapi_schema.pop(key, None)
     
-    # Convert format fields if needed
+    # Convert format fields if needed (rebuilt, so the input properties are left untouched)
     if 'properties' in openapi_schema:
-        for prop_name, prop_schema in openapi_schema['properties'].items():
-            if isinstance(prop_schema, dict):
-                openapi_schema['properties'][prop_name] = _convert_property_to_openapi(prop_schema)
+        openapi_schema['properties'] = {
+            prop_name: _convert_property_to_openapi(prop_schema) if isinstance(prop_schema, dict) else prop_schema
+            for prop_name, prop_schema in openapi_schema['properties'].items()
+        }
     
     return openapi_schema
 
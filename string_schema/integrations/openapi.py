@@ -8,10 +8,14 @@ from typing import Any, Dict, List, Union, Optional
 import logging
 
 from ..core.fields import SimpleField
+from ..core.keywords import JSON_SCHEMA_FORMATS, FIELD_CONSTRAINT_KEYWORDS
 from .json_schema import to_json_schema, convert_to_openapi_schema
 
 logger = logging.getLogger(__name__)
 
+# OpenAPI doesn't have standard phone format
+_UNSUPPORTED_OPENAPI_FORMATS = frozenset({'phone'})
+
 
 def to_openapi_schema(fields: Dict[str, Union[str, SimpleField]],
                      title: str = "Generated Schema",
@@ -32,8 +36,8 @@ def to_openapi_schema(fields: Dict[str, Union[str, SimpleField]],
     # First convert to JSON Schema
     json_schema = to_json_schema(fields, title, description)
     
-    # Then convert to OpenAPI format
-    openapi_schema = convert_to_openapi_schema(json_schema)
+    # Then convert to OpenAPI format; the schema is ours, so no copy is needed
+    openapi_schema = convert_to_openapi_schema(json_schema, copy=False)
     
     # Add OpenAPI specific metadata
     if version:
@@ -111,11 +115,10 @@ def string_to_openapi(schema_str: str, title: str = "Generated Schema",
     """
     # Import here to avoid circular imports
     from ..parsing.string_parser import parse_string_schema
-    from .json_schema import convert_to_openapi_schema
 
-    # Convert string to JSON Schema, then to OpenAPI
+    # Convert string to JSON Schema (a fresh copy), then to OpenAPI in place
     json_schema = parse_string_schema(schema_str)
-    return convert_to_openapi_schema(json_schema)
+    return convert_to_openapi_schema(json_schema, copy=False)
 
 
 # Reverse conversion functions
@@ -212,30 +215,18 @@ def create_openapi_parameter(field_name: str,
         "type": field.field_type
     }
     
-    if field.format_hint:
-        if field.format_hint == "email":
-            schema["format"] = "email"
-        elif field.format_hint in ["url", "uri"]:
-            schema["format"] = "uri"
-        elif field.format_hint == "datetime":
-            schema["format"] = "date-time"
-        elif field.format_hint == "date":
-            schema["format"] = "date"
-        elif field.format_hint == "uuid":
-            schema["format"] = "uuid"
+    fmt = JSON_SCHEMA_FORMATS.get(field.format_hint)
+    if fmt:
+        schema["format"] = fmt
     
     if field.choices:
         schema["enum"] = field.choices
     
     # Add constraints
-    if field.min_val is not None:
-        schema["minimum"] = field.min_val
-    if field.max_val is not None:
-        schema["maximum"] = field.max_val
-    if field.min_length is not None:
-        schema["minLength"] = field.min_length
-    if field.max_length is not None:
-        schema["maxLength"] = field.max_length
+    for attr, key in FIELD_CONSTRAINT_KEYWORDS:
+        value = getattr(field, attr)
+        if value is not None:
+            schema[key] = value
     
     parameter = {
         "name": field_name,
@@ -375,8 +366,7 @@ def validate_openapi_compatibility(fields: Dict[str, SimpleField]) -> Dict[str,
             result['warnings'].append(f"Field '{field_name}' uses union types - consider using oneOf/anyOf")
         
         # Check for unsupported format hints
-        unsupported_formats = ['phone']  # OpenAPI doesn't have standard phone format
-        if field.format_hint in unsupported_formats:
+        if field.format_hint in _UNSUPPORTED_OPENAPI_FORMATS:
             result['warnings'].append(f"Field '{field_name}' format '{field.format_hint}' not standard in OpenAPI")
         
         # Check for complex constraints
@@ -5,9 +5,11 @@ Contains functions for creating Pydantic models from Simple Schema definitions.
 """
 
 from typing import Any, Dict, List, Optional, Union, Type
+import functools
 import logging
 
 from ..core.fields import SimpleField
+from ..core.keywords import FIELD_CONSTRAINT_KEYWORDS
 
 # Optional pydantic import
 try:
@@ -19,8 +21,28 @@ except ImportError:
     Field = None
     create_model = None
 
+# Pydantic v2 can postpone building a model's core schema until first use,
+# so models that are only created or inspected never pay for it
+try:
+    from pydantic import ConfigDict
+    _DEFERRED_BUILD = {'__config__': ConfigDict(defer_build=True)}
+except ImportError:
+    _DEFERRED_BUILD = {}
+
 logger = logging.getLogger(__name__)
 
+# JSON Schema primitive types and the Python types (or their source names) they map to
+_JSON_TYPE_TO_PY = {
+    'string': str,
+    'integer': int,
+    'number': float,
+    'boolean': bool
+}
+_JSON_TYPE_TO_PY_NAME = {json_type: py_type.__name__ for json_type, py_type in _JSON_TYPE_TO_PY.items()}
+
+# Format hints that map onto dedicated Pydantic types
+_PYDANTIC_FORMAT_HINTS = frozenset({'email', 'url', 'uuid'})
+
 
 def create_pydantic_model(name: str, fields: Dict[str, Union[str, SimpleField]],
                          base_class: Type = None) -> Type:
@@ -41,6 +63,20 @@ def create_pydantic_model(name: str, fields: Dict[str, Union[str, SimpleField]],
     if base_class is None:
         base_class = BaseModel
 
+    # Identical definitions reuse one model class; fields holding values other
+    # than plain scalars and tuples (e.g. list defaults) or SimpleField
+    # subclasses skip the cache
+    try:
+        signature = tuple((field_name, _field_signature(field_def))
+                          for field_name, field_def in fields.items())
+    except TypeError:
+        return _create_pydantic_model(name, fields, base_class)
+    return _create_pydantic_model_cached(name, signature, base_class)
+
+
+def _create_pydantic_model(name: str, fields: Dict[str, Union[str, SimpleField]],
+                           base_class: Type) -> Type:
+    """Build a Pydantic model from field definitions"""
     pydantic_fields = {}
 
     for field_name, field_def in fields.items():
@@ -54,20 +90,61 @@ def create_pydantic_model(name: str, fields: Dict[str, Union[str, SimpleField]],
     return create_model(name, __base__=base_class, **pydantic_fields)
 
 
+@functools.lru_cache(maxsize=256)
+def _create_pydantic_model_cached(name: str, signature: tuple, base_class: Type) -> Type:
+    """Build a Pydantic model once per name, field signature and base class"""
+    fields = {}
+    for field_name, tagged_args in signature:
+        field = SimpleField(*_untag_value(tagged_args))
+        if field.choices is not None:
+            field.choices = list(field.choices)
+        field.union_types = list(field.union_types)
+        fields[field_name] = field
+    return _create_pydantic_model(name, fields, base_class)
+
+
+def _field_signature(field_def: Union[str, SimpleField]) -> tuple:
+    """Return the SimpleField constructor arguments for a field as a type-tagged tuple"""
+    if isinstance(field_def, str):
+        return _tag_value((field_def,))
+    if type(field_def) is not SimpleField:
+        raise TypeError("SimpleField subclasses are not cached")
+    return _tag_value((
+        field_def.field_type, field_def.description, field_def.required,
+        field_def.default, field_def.min_val, field_def.max_val,
+        field_def.min_length, field_def.max_length,
+        None if field_def.choices is None else tuple(field_def.choices),
+        field_def.min_items, field_def.max_items, field_def.format_hint,
+        tuple(field_def.union_types)
+    ))
+
+
+# Field values that can be part of a cache key; anything else skips the cache
+_CACHEABLE_SCALARS = (str, int, float, bool, type(None))
+
+
+def _tag_value(value: Any) -> tuple:
+    """Pair a value with its exact type and repr so True, 1 and 1.0 (or 0.0 and -0.0) never share a key"""
+    if type(value) is tuple:
+        return (tuple, tuple(_tag_value(item) for item in value))
+    if type(value) not in _CACHEABLE_SCALARS:
+        raise TypeError(f"{type(value).__name__} values are not cached")
+    return (type(value), repr(value), value)
+
+
+def _untag_value(tagged: tuple) -> Any:
+    """Recover the original value from _tag_value output"""
+    if tagged[0] is tuple:
+        return tuple(_untag_value(item) for item in tagged[1])
+    return tagged[2]
+
+
 def _simple_field_to_pydantic(field: SimpleField) -> tuple:
     """Convert SimpleField to Pydantic field specification"""
     if not HAS_PYDANTIC:
         raise ImportError("Pydantic is required for this function")
 
-    # Type mapping
-    type_mapping = {
-        'string': str,
-        'integer': int,
-        'number': float,
-        'boolean': bool
-    }
-
-    python_type = type_mapping.get(field.field_type, str)
+    python_type = _JSON_TYPE_TO_PY.get(field.field_type, str)
 
     # Handle union types
     if field.union_types and len(field.union_types) > 1:
@@ -77,7 +154,7 @@ def _simple_field_to_pydantic(field: SimpleField) -> tuple:
             if union_type == "null":
                 union_python_types.append(type(None))
             else:
-                union_python_types.append(type_mapping.get(union_type, str))
+                union_python_types.append(_JSON_TYPE_TO_PY.get(union_type, str))
         python_type = TypingUnion[tuple(union_python_types)]
 
     # Handle optional fields
@@ -161,25 +238,17 @@ def create_pydantic_from_json_schema(json_schema: Dict[str, Any], name: str) ->
         python_type, field_info = _json_schema_to_pydantic_field(field_schema, field_name in required_fields, f"{name}{field_name.title()}")
         pydantic_fields[field_name] = (python_type, field_info)
     
-    return create_model(name, **pydantic_fields)
+    return create_model(name, **_DEFERRED_BUILD, **pydantic_fields)
 
 
 def _json_schema_to_pydantic_field(field_schema: Dict[str, Any], required: bool = True, parent_name: str = "Nested") -> tuple:
     """Convert JSON Schema field to Pydantic field specification"""
-    # Type mapping
-    type_mapping = {
-        'string': str,
-        'integer': int,
-        'number': float,
-        'boolean': bool
-    }
-
     # Handle union types
     if 'anyOf' in field_schema:
         from typing import Union as TypingUnion
         union_types = []
         for union_option in field_schema['anyOf']:
-            option_type = type_mapping.get(union_option.get('type', 'string'), str)
+            option_type = _JSON_TYPE_TO_PY.get(union_option.get('type', 'string'), str)
             union_types.append(option_type)
         python_type = TypingUnion[tuple(union_types)]
     elif field_schema.get('type') == 'object':
@@ -197,11 +266,11 @@ def _json_schema_to_pydantic_field(field_schema: Dict[str, Any], required: bool
         else:
             # Array of primitives
             from typing import List
-            item_type = type_mapping.get(items_schema.get('type', 'string'), str)
+            item_type = _JSON_TYPE_TO_PY.get(items_schema.get('type', 'string'), str)
             python_type = List[item_type]
     else:
         field_type = field_schema.get('type', 'string')
-        python_type = type_mapping.get(field_type, str)
+        python_type = _JSON_TYPE_TO_PY.get(field_type, str)
 
     # Handle optional fields
     if not required:
@@ -379,12 +448,15 @@ def _pydantic_field_to_simple_field(field_info: Any, field_name: str) -> SimpleF
     return simple_field
 
 
-def validate_pydantic_compatibility(fields: Dict[str, SimpleField]) -> Dict[str, Any]:
+def validate_pydantic_compatibility(fields: Dict[str, SimpleField],
+                                    fail_fast: bool = False) -> Dict[str, Any]:
     """
     Validate that Simple Schema fields are compatible with Pydantic.
     
     Args:
         fields: Dictionary of SimpleField objects
+        fail_fast: Stop at the first incompatible field instead of collecting
+            every warning and error
         
     Returns:
         Validation result dictionary
@@ -400,7 +472,7 @@ def validate_pydantic_compatibility(fields: Dict[str, SimpleField]) -> Dict[str,
         if field.union_types and len(field.union_types) > 2:
             result['warnings'].append(f"Field '{field_name}' has complex union type - may need manual handling")
         
-        if field.format_hint and field.format_hint not in ['email', 'url', 'uuid']:
+        if field.format_hint and field.format_hint not in _PYDANTIC_FORMAT_HINTS:
             result['warnings'].append(f"Field '{field_name}' format hint '{field.format_hint}' may not be fully supported")
         
         # Check for conflicting constraints
@@ -411,6 +483,9 @@ def validate_pydantic_compatibility(fields: Dict[str, SimpleField]) -> Dict[str,
         if field.min_length is not None and field.max_length is not None:
             if field.min_length > field.max_length:
                 result['errors'].append(f"Field '{field_name}' has min_length > max_length")
+        
+        if fail_fast and result['errors']:
+            break
     
     result['compatible'] = len(result['errors']) == 0
     return result
@@ -558,14 +633,9 @@ def _json_schema_to_simple_field(field_schema: Dict[str, Any], required: bool) -
         'description': field_schema.get('description', ''),
     }
 
-    if 'minimum' in field_schema:
-        kwargs['min_val'] = field_schema['minimum']
-    if 'maximum' in field_schema:
-        kwargs['max_val'] = field_schema['maximum']
-    if 'minLength' in field_schema:
-        kwargs['min_length'] = field_schema['minLength']
-    if 'maxLength' in field_schema:
-        kwargs['max_length'] = field_schema['maxLength']
+    for attr, key in FIELD_CONSTRAINT_KEYWORDS:
+        if key in field_schema:
+            kwargs[attr] = field_schema[key]
     if 'enum' in field_schema:
         kwargs['choices'] = field_schema['enum']
     if format_hint:
@@ -606,14 +676,7 @@ def generate_pydantic_code(name: str, fields: Dict[str, SimpleField]) -> str:
 def _generate_pydantic_field_code(field_name: str, field: SimpleField) -> str:
     """Generate code for a single Pydantic field"""
     # Determine Python type
-    type_mapping = {
-        'string': 'str',
-        'integer': 'int', 
-        'number': 'float',
-        'boolean': 'bool'
-    }
-    
-    python_type = type_mapping.get(field.field_type, 'str')
+    python_type = _JSON_TYPE_TO_PY_NAME.get(field.field_type, 'str')
     
     # Handle union types
     if field.union_types and len(field.union_types) > 1:
@@ -622,7 +685,7 @@ def _generate_pydantic_field_code(field_name: str, field: SimpleField) -> str:
             if union_type == 'null':
                 union_types.append('None')
             else:
-                union_types.append(type_mapping.get(union_type, 'str'))
+                union_types.append(_JSON_TYPE_TO_PY_NAME.get(union_type, 'str'))
         python_type = f"Union[{', '.join(union_types)}]"
     
     # Handle optional
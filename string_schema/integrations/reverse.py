@@ -17,6 +17,7 @@ from more complex formats to simpler string syntax.
 
 from typing import Any, Dict, List, Union, Optional, Type
 import logging
+import weakref
 
 # Optional pydantic import
 try:
@@ -28,6 +29,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Model classes don't change after creation; entries vanish with the class
+_MODEL_STRING_CACHE: "weakref.WeakKeyDictionary[type, str]" = weakref.WeakKeyDictionary()
+
 
 def model_to_string(model: Type[BaseModel], include_name: bool = False) -> str:
     """
@@ -48,9 +52,18 @@ def model_to_string(model: Type[BaseModel], include_name: bool = False) -> str:
     if not HAS_PYDANTIC:
         raise ImportError("Pydantic is required for model_to_string. Install with: pip install pydantic")
     
+    try:
+        cached = _MODEL_STRING_CACHE.get(model)
+    except TypeError:
+        # Not weak-referenceable (not a model class); let conversion report it
+        return json_schema_to_string(model_to_json_schema(model))
+    if cached is not None:
+        return cached
+    
     # First convert to JSON Schema, then to string
     json_schema = model_to_json_schema(model)
-    return json_schema_to_string(json_schema)
+    result = _MODEL_STRING_CACHE[model] = json_schema_to_string(json_schema)
+    return result
 
 
 def model_to_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
@@ -129,6 +142,12 @@ def openapi_to_string(openapi_schema: Dict[str, Any]) -> str:
     return json_schema_to_string(json_schema)
 
 
+# OpenAPI-specific keywords that aren't in JSON Schema
+_OPENAPI_ONLY_KEYWORDS = frozenset({
+    'example', 'examples', 'discriminator', 'xml', 'externalDocs'
+})
+
+
 def openapi_to_json_schema(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert OpenAPI schema to JSON Schema.
@@ -143,30 +162,40 @@ def openapi_to_json_schema(openapi_schema: Dict[str, Any]) -> Dict[str, Any]:
         openapi_schema = {"type": "string", "format": "email"}
         json_schema = openapi_to_json_schema(openapi_schema)
     """
-    # OpenAPI 3.0 schemas are mostly compatible with JSON Schema
-    # Just need to handle some OpenAPI-specific keywords
-    json_schema = openapi_schema.copy()
-    
-    # Remove OpenAPI-specific keywords that aren't in JSON Schema
-    openapi_only_keywords = [
-        'example', 'examples', 'discriminator', 'xml', 'externalDocs'
-    ]
-    
-    for keyword in openapi_only_keywords:
-        json_schema.pop(keyword, None)
+    return _openapi_node_to_json_schema(openapi_schema, {})
+
+
+def _openapi_node_to_json_schema(openapi_schema: Dict[str, Any], ancestors: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+    """Convert one OpenAPI schema node; ancestors maps id() of nodes being converted to their output"""
+    # A node that contains itself maps back onto its converted ancestor,
+    # keeping the cycle in the output instead of recursing forever
+    converted = ancestors.get(id(openapi_schema))
+    if converted is not None:
+        return converted
     
-    # Handle nested properties recursively
-    if 'properties' in json_schema:
-        for prop_name, prop_schema in json_schema['properties'].items():
-            json_schema['properties'][prop_name] = openapi_to_json_schema(prop_schema)
+    # OpenAPI 3.0 schemas are mostly compatible with JSON Schema
+    # Just need to drop OpenAPI-specific keywords, in a single pass
+    json_schema = {k: v for k, v in openapi_schema.items() if k not in _OPENAPI_ONLY_KEYWORDS}
     
-    # Handle array items
-    if 'items' in json_schema:
-        json_schema['items'] = openapi_to_json_schema(json_schema['items'])
+    ancestors[id(openapi_schema)] = json_schema
+    try:
+        # Handle nested properties recursively (rebuilt, so the input is left untouched)
+        if 'properties' in json_schema:
+            json_schema['properties'] = {
+                prop_name: _openapi_node_to_json_schema(prop_schema, ancestors)
+                for prop_name, prop_schema in json_schema['properties'].items()
+            }
+        
+        # Handle array items
+        if 'items' in json_schema:
+            json_schema['items'] = _openapi_node_to_json_schema(json_schema['items'], ancestors)
+    finally:
+        del ancestors[id(openapi_schema)]
     
     return json_schema
 
 
+
 # Helper functions for JSON Schema to string conversion
 
 def _convert_object_schema_to_string(json_schema: Dict[str, Any]) -> str:
@@ -178,17 +207,13 @@ def _convert_object_schema_to_string(json_schema: Dict[str, Any]) -> str:
         return "{}"
     
     field_strings = []
+    append = field_strings.append
     for field_name, field_schema in properties.items():
         field_str = _convert_field_schema_to_string(field_name, field_schema)
-        if field_name not in required_fields:
-            field_str += "?"
-        field_strings.append(field_str)
+        append(field_str if field_name in required_fields else f"{field_str}?")
     
-    # Check if this should be wrapped in braces (nested object)
-    if len(field_strings) > 1 or any(':' in fs for fs in field_strings):
-        return "{" + ", ".join(field_strings) + "}"
-    else:
-        return ", ".join(field_strings)
+    # Every field renders as "name:type", so the fields are always wrapped in braces
+    return f"{{{', '.join(field_strings)}}}"
 
 
 def _convert_array_schema_to_string(json_schema: Dict[str, Any]) -> str:
@@ -217,6 +242,24 @@ def _convert_field_schema_to_string(field_name: str, field_schema: Dict[str, Any
         return f"{field_name}:{field_type}"
 
 
+# JSON Schema formats and types and their string syntax names
+_FORMAT_TO_STRING_TYPE = {
+    'email': 'email',
+    'uri': 'url', 
+    'url': 'url',
+    'date-time': 'datetime',
+    'date': 'date',
+    'uuid': 'uuid',
+    'phone': 'phone'
+}
+_JSON_TYPE_TO_STRING_TYPE = {
+    'string': 'string',
+    'integer': 'int',
+    'number': 'number',
+    'boolean': 'bool'
+}
+
+
 def _get_simple_type_from_json_schema(field_schema: Dict[str, Any]) -> str:
     """Extract simple type from JSON Schema field."""
     json_type = field_schema.get('type', 'string')
@@ -224,17 +267,8 @@ def _get_simple_type_from_json_schema(field_schema: Dict[str, Any]) -> str:
     
     # Handle special formats
     if format_hint:
-        format_mapping = {
-            'email': 'email',
-            'uri': 'url', 
-            'url': 'url',
-            'date-time': 'datetime',
-            'date': 'date',
-            'uuid': 'uuid',
-            'phone': 'phone'
-        }
-        if format_hint in format_mapping:
-            return format_mapping[format_hint]
+        if format_hint in _FORMAT_TO_STRING_TYPE:
+            return _FORMAT_TO_STRING_TYPE[format_hint]
     
     # Handle enums
     if 'enum' in field_schema:
@@ -242,14 +276,7 @@ def _get_simple_type_from_json_schema(field_schema: Dict[str, Any]) -> str:
         return f"enum({','.join(str(v) for v in enum_values)})"
     
     # Handle basic types
-    type_mapping = {
-        'string': 'string',
-        'integer': 'int',
-        'number': 'number',
-        'boolean': 'bool'
-    }
-    
-    return type_mapping.get(json_type, 'string')
+    return _JSON_TYPE_TO_STRING_TYPE.get(json_type, 'string')
 
 
 def _extract_constraints_from_json_schema(field_schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -12,6 +12,10 @@ from .string_parser import validate_string_schema
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
+_OPERATOR_RE = re.compile(r'([:|,])')
+_DATE_PREFIX_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
 
 def optimize_string_schema(schema_str: str) -> str:
     """Optimize enhanced schema string for better readability"""
@@ -33,11 +37,11 @@ def optimize_string_schema(schema_str: str) -> str:
 def _format_schema_string(schema_str: str) -> str:
     """Format schema string for better readability"""
     # Remove extra whitespace
-    schema_str = re.sub(r'\s+', ' ', schema_str.strip())
+    schema_str = _WHITESPACE_RE.sub(' ', schema_str.strip())
     
     # Add spacing around operators
-    schema_str = re.sub(r'([:|,])', r'\1 ', schema_str)
-    schema_str = re.sub(r'\s+', ' ', schema_str)
+    schema_str = _OPERATOR_RE.sub(r'\1 ', schema_str)
+    schema_str = _WHITESPACE_RE.sub(' ', schema_str)
     
     # Format nested structures
     if '{' in schema_str and '}' in schema_str:
@@ -156,7 +160,7 @@ def _infer_field_type(field_name: str, value: Any) -> str:
             return f"{field_name}:email"
         elif value.startswith(('http://', 'https://')):
             return f"{field_name}:url"
-        elif re.match(r'^\d{4}-\d{2}-\d{2}', value):
+        elif _DATE_PREFIX_RE.match(value):
             return f"{field_name}:date"
         else:
             return f"{field_name}:string"
@@ -4,8 +4,10 @@ String-based schema parsing for String Schema
 Contains functionality for parsing human-readable schema strings into JSON Schema.
 """
 
+import functools
+import json
 import re
-from typing import Dict, Any, List, Union, Optional
+from typing import Dict, Any, List, Tuple, Union, Optional
 import logging
 
 from ..core.fields import SimpleField
@@ -13,10 +15,114 @@ from ..core.builders import simple_schema, list_of_objects_schema
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single type/enum/array definition; longer input is not a
+# realistic schema and is rejected before any pattern matching
+_MAX_FIELD_LEN = 4096
+
+# Precompiled patterns used on every parse
+_ARRAY_CONSTRAINT_RE = re.compile(r'^\[([^\]]+)\]\(([^)]+)\)$')
+_ENUM_PREFIXES = ('enum(', 'choice(', 'select(')
+_ARRAY_TYPE_RE = re.compile(r'^(?:array|list)\(([^)]+)\)$')
+_TYPE_CONSTRAINT_RE = re.compile(r'^(\w+)\(([^)]+)\)$')
+_UNION_RE = re.compile(r'\s*\w+\s*(?:\|\s*\w+\s*)+')
+_UNION_TOKEN_RE = re.compile(r'\w+')
+_TRIPLE_QUOTE_RE = re.compile(r'^[\'\"]{3}|[\'\"]{3}$')
+_COMMENT_RE = re.compile(r'#.*$', re.MULTILINE)
+# Constraint detection for feature reporting: string(min=1,max=100), int(0,120),
+# number(min=0), text(max=500) and [string](max=5). Possessive quantifiers stop
+# the engine from backtracking through argument lists that never close. The
+# alternatives share one "(...)" tail, and the lookahead on their first letters
+# lets the engine skip every other position without trying each alternative.
+_CONSTRAINT_DETECT_RE = re.compile(r'(?=[sint\]])(?:string|int|number|text|\])\([^)]++\)')
+
+# Feature-triggering tokens, collected in a single scan ('date' also covers 'datetime')
+_FEATURE_TOKEN_RE = re.compile(r'[\[\]{}?|]|enum\(|choice\(|select\(|email|url|date|uuid|phone')
+_TOKEN_TO_FEATURE = {
+    '[': 'arrays',
+    ']': 'arrays',
+    '{': 'objects',
+    '}': 'objects',
+    '?': 'optional_fields',
+    '|': 'union_types',
+    'enum(': 'enums',
+    'choice(': 'enums',
+    'select(': 'enums',
+    'email': 'special_types',
+    'url': 'special_types',
+    'date': 'special_types',
+    'uuid': 'special_types',
+    'phone': 'special_types',
+}
+
+_NESTING_CHARS = frozenset('[]{}()')
+_STRUCTURAL_CHAR_RE = re.compile(r'[,\[\]{}()]')
+
+# Characters that rule out the flat-schema fast path: nesting, constraints,
+# comments, quotes and anything str.splitlines() treats as a line break
+_COMPLEX_CHARS = frozenset('[]{}()#\'"\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029')
+
+_SIMPLE_TYPES = frozenset({
+    'string', 'str', 'text', 'int', 'integer', 'number', 'float', 'decimal',
+    'bool', 'boolean', 'email', 'url', 'uri', 'datetime', 'date', 'uuid', 'phone'
+})
+
+# Special types that are strings carrying a format hint
+_STRING_BASE_TYPES = frozenset({'string', 'str', 'text'})
+_FORMAT_HINT_TYPES = frozenset({'email', 'url', 'uri', 'datetime', 'date', 'uuid', 'phone'})
+
+# Format hint -> JSON Schema "format" value (phone has no standard format)
+_FORMAT_MAP = {
+    'email': 'email',
+    'url': 'uri',
+    'uri': 'uri',
+    'datetime': 'date-time',
+    'date': 'date',
+    'uuid': 'uuid',
+}
+
+_TYPE_MAPPING = {
+    # Basic types
+    'str': 'string',
+    'string': 'string',
+    'text': 'string',
+    'int': 'integer',
+    'integer': 'integer',
+    'num': 'number',
+    'number': 'number',
+    'float': 'number',
+    'double': 'number',
+    'decimal': 'number',
+    'bool': 'boolean',
+    'boolean': 'boolean',
+
+    # Special types (normalized to string, format handled separately)
+    'email': 'string',
+    'url': 'string',
+    'uri': 'string',
+    'datetime': 'string',
+    'date': 'string',
+    'uuid': 'string',
+    'phone': 'string',
+    'tel': 'string',
+    'null': 'null',
+}
+
 
 def parse_string_schema(schema_str: str, is_list: bool = False) -> Dict[str, Any]:
     """Parse enhanced string schema with support for arrays, enums, unions, and special types"""
-    schema_str = schema_str.strip()
+    # Results are cached as JSON text, so every caller gets a fresh dict
+    return json.loads(_string_to_json_schema_cached(schema_str.strip()))
+
+
+def _parse_string_schema(schema_str: str) -> Dict[str, Any]:
+    """Parse a stripped schema string into a JSON Schema dictionary"""
+
+    # Fast path: flat field lists like "name:string, age:int?" need no
+    # comment/quote normalization, nesting-aware splitting or structure dispatch
+    if not _COMPLEX_CHARS.intersection(schema_str):
+        fields = _parse_field_parts(schema_str.split(','))
+        return _structure_to_json_schema({"type": "object", "fields": fields})
+
     parsed_structure = _parse_schema_structure(schema_str)
     return _structure_to_json_schema(parsed_structure)
 
@@ -40,7 +146,7 @@ def _parse_schema_structure(schema_str: str) -> Dict[str, Any]:
         array_constraints = {}
 
         # Extract constraints if present: [type](constraints)
-        constraint_match = re.match(r'^\[([^\]]+)\]\(([^)]+)\)$', schema_str)
+        constraint_match = _ARRAY_CONSTRAINT_RE.match(schema_str)
         if constraint_match:
             inner_content = constraint_match.group(1).strip()
             constraint_str = constraint_match.group(2).strip()
@@ -67,7 +173,7 @@ def _parse_schema_structure(schema_str: str) -> Dict[str, Any]:
         # Array of simple types: [string], [int], [email], etc.
         elif _is_simple_type(inner_content):
             original_type = inner_content.strip().lower()
-            normalized_type = _normalize_type_name(original_type)
+            normalized_type = _TYPE_MAPPING.get(original_type, 'string')
             return {
                 "type": "array",
                 "items": {
@@ -101,7 +207,17 @@ def _parse_schema_structure(schema_str: str) -> Dict[str, Any]:
 
 def _parse_array_constraints(constraint_str: str) -> Dict[str, Any]:
     """Parse array constraints like 'min=1,max=5'"""
-    constraints = {}
+    return dict(_parse_kv_constraints(constraint_str))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_kv_constraints(constraint_str: str) -> Tuple[Tuple[str, Any], ...]:
+    """Parse 'key=value' constraint lists shared by both array syntaxes.
+
+    Returns an immutable tuple of (key, value) pairs so results can be cached;
+    the same fragments (min=1, max=5, ...) recur across fields and schemas.
+    """
+    constraints = []
     parts = [part.strip() for part in constraint_str.split(',')]
     
     for part in parts:
@@ -112,20 +228,24 @@ def _parse_array_constraints(constraint_str: str) -> Dict[str, Any]:
             
             try:
                 if key in ['min', 'max']:
-                    constraints[key] = int(value)
+                    constraints.append((key, int(value)))
                 else:
-                    constraints[key] = value
+                    constraints.append((key, value))
             except ValueError:
                 logger.warning(f"Invalid array constraint: {part}")
     
-    return constraints
+    return tuple(constraints)
 
 
 def _parse_object_fields(fields_str: str) -> Dict[str, Any]:
     """Parse object fields with enhanced syntax"""
     fields_str = _normalize_string_schema(fields_str)
     field_parts = _split_field_definitions_with_nesting(fields_str)
-    
+    return _parse_field_parts(field_parts)
+
+
+def _parse_field_parts(field_parts: List[str]) -> Dict[str, Any]:
+    """Parse already-split field definitions into a field mapping"""
     fields = {}
     for field_part in field_parts:
         field_name, field_def = _parse_single_field_with_nesting(field_part.strip())
@@ -160,22 +280,23 @@ def _parse_single_field_with_nesting(field_str: str) -> tuple:
         
         # Handle union types: string|int|null
         elif '|' in field_def:
-            union_types = [t.strip() for t in field_def.split('|')]
-            field_type = _normalize_type_name(union_types[0])  # Use first type as primary
+            if not _UNION_RE.fullmatch(field_def):
+                raise ValueError(f"Invalid union type definition for field '{field_name}': {field_def}")
+            union_types = [_normalize_type_name(t) for t in _UNION_TOKEN_RE.findall(field_def)]
             
-            # Create field with union support
-            field_obj = SimpleField(
-                field_type=field_type,
+            # Create field with union support, using first type as primary
+            field_obj = _ParsedField(
+                field_type=union_types[0],
                 required=required
             )
             # Store union info for JSON schema generation
-            field_obj.union_types = [_normalize_type_name(t) for t in union_types]
+            field_obj.union_types = union_types
             return field_name, field_obj
         
         # Handle enum types: enum(value1,value2,value3) or choice(...)
-        elif field_def.startswith(('enum(', 'choice(', 'select(')):
+        elif field_def.startswith(_ENUM_PREFIXES):
             enum_values = _parse_enum_values(field_def)
-            field_obj = SimpleField(
+            field_obj = _ParsedField(
                 field_type="string",  # Enums are string-based
                 required=required,
                 choices=enum_values
@@ -202,120 +323,146 @@ def _parse_single_field_with_nesting(field_str: str) -> tuple:
             field_type, constraints = _parse_type_definition(field_def)
 
             # Add format hint for special types
-            if original_type in ['email', 'url', 'uri', 'datetime', 'date', 'uuid', 'phone']:
+            if original_type in _FORMAT_HINT_TYPES:
                 constraints['format_hint'] = original_type
                 field_type = 'string'  # All special types are strings with format hints
 
-            field_obj = SimpleField(
-                field_type=field_type,
-                required=required,
-                **constraints
-            )
+            if constraints.keys() <= {'format_hint'}:
+                # Unconstrained field: share the canonical instance
+                field_obj = _interned_field(field_type, required, constraints.get('format_hint'))
+            else:
+                field_obj = _ParsedField(
+                    field_type=field_type,
+                    required=required,
+                    **constraints
+                )
             return field_name, field_obj
     
     # Field name only (default to string)
     else:
         field_name = field_str.strip()
-        field_obj = SimpleField(
-            field_type="string",
-            required=required
-        )
-        return field_name, field_obj
+        return field_name, _interned_field("string", required)
+
+
+class _ParsedField:
+    """Parser-internal field record with SimpleField's attributes and constructor.
+
+    Parsed fields never leave the parser (results are emitted as JSON
+    Schema), so they can use __slots__ without changing the public
+    SimpleField class.
+    """
+
+    __slots__ = (
+        'field_type', 'description', 'required', 'default', 'min_val', 'max_val',
+        'min_length', 'max_length', 'choices', 'min_items', 'max_items',
+        'format_hint', 'union_types'
+    )
+
+    __init__ = SimpleField.__init__
+
+
+@functools.lru_cache(maxsize=None)
+def _interned_field(field_type: str, required: bool, format_hint: Optional[str] = None) -> _ParsedField:
+    """Return a shared parsed field for fields without constraints.
+
+    Parsed fields are only read when generating JSON Schema, so plain
+    definitions like "name", "age:int" or "email:email?" can reuse one
+    instance instead of allocating a new field per occurrence. The key
+    space is bounded by the known types, formats and the required flag.
+    """
+    return _ParsedField(field_type=field_type, required=required, format_hint=format_hint)
 
 
 def _parse_enum_values(enum_def: str) -> List[str]:
     """Parse enum values from enum(value1,value2,value3)"""
-    # Extract content between parentheses
-    match = re.match(r'^(?:enum|choice|select)\(([^)]+)\)$', enum_def)
-    if not match:
+    if len(enum_def) > _MAX_FIELD_LEN:
+        logger.warning(f"Enum definition exceeds {_MAX_FIELD_LEN} characters, ignoring values")
+        return []
+    
+    # Extract content between parentheses: enum(...), choice(...) or select(...)
+    if not (enum_def.startswith(_ENUM_PREFIXES) and enum_def.endswith(')')):
+        return []
+    body = enum_def[enum_def.index('(') + 1:-1]
+    if not body or ')' in body:
         return []
     
-    values_str = match.group(1)
-    values = [v.strip() for v in values_str.split(',')]
-    return values
+    return list(_split_enum_values(body))
+
+
+@functools.lru_cache(maxsize=256)
+def _split_enum_values(values_str: str) -> Tuple[str, ...]:
+    """Split an enum body into stripped values, once per distinct body"""
+    return tuple(map(str.strip, values_str.split(',')))
 
 
 def _parse_array_type_definition(array_def: str) -> tuple:
     """Parse array(type,constraints) or list(type,constraints)"""
+    if len(array_def) > _MAX_FIELD_LEN:
+        logger.warning(f"Array definition exceeds {_MAX_FIELD_LEN} characters, using defaults")
+        return "string", {}
+    
     # Extract content between parentheses
-    match = re.match(r'^(?:array|list)\(([^)]+)\)$', array_def)
+    match = _ARRAY_TYPE_RE.match(array_def)
     if not match:
         return "string", {}
     
-    content = match.group(1)
-    parts = [p.strip() for p in content.split(',')]
-    
-    # First part is the type
-    array_type = _normalize_type_name(parts[0]) if parts else "string"
-    
-    # Remaining parts are constraints
-    constraints = {}
-    for part in parts[1:]:
-        if '=' in part:
-            key, value = part.split('=', 1)
-            key = key.strip()
-            value = value.strip()
-            
-            try:
-                if key in ['min', 'max']:
-                    constraints[key] = int(value)
-                else:
-                    constraints[key] = value
-            except ValueError:
-                logger.warning(f"Invalid array constraint: {part}")
+    # First part is the type, remaining parts are constraints
+    type_part, _, constraint_str = match.group(1).partition(',')
+    array_type = _normalize_type_name(type_part.strip())
     
-    return array_type, constraints
+    return array_type, dict(_parse_kv_constraints(constraint_str))
 
 
 def _is_simple_type(type_str: str) -> bool:
     """Check if string represents a simple type"""
-    simple_types = [
-        'string', 'str', 'text', 'int', 'integer', 'number', 'float', 'decimal',
-        'bool', 'boolean', 'email', 'url', 'uri', 'datetime', 'date', 'uuid', 'phone'
-    ]
-    return type_str.strip().lower() in simple_types
+    return type_str.strip().lower() in _SIMPLE_TYPES
 
 
 def _structure_to_json_schema(structure: Dict[str, Any]) -> Dict[str, Any]:
     """Convert parsed structure to JSON Schema"""
-    if structure["type"] == "object":
-        return _object_structure_to_schema(structure)
-    elif structure["type"] == "array":
-        return _array_structure_to_schema(structure)
-    else:
-        raise ValueError(f"Unknown structure type: {structure['type']}")
+    # Walk nested structures with an explicit stack: each node's schema dict is
+    # created empty by its parent (preserving key order) and filled in when popped.
+    root = {}
+    stack = [(structure, root)]
+
+    while stack:
+        node, schema = stack.pop()
+        if node["type"] == "object":
+            _object_structure_to_schema(node, schema, stack)
+        elif node["type"] == "array":
+            _array_structure_to_schema(node, schema, stack)
+        else:
+            raise ValueError(f"Unknown structure type: {node['type']}")
+
+    return root
 
 
-def _object_structure_to_schema(structure: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert object structure to JSON Schema"""
-    properties = {}
-    required = []
+def _object_structure_to_schema(structure: Dict[str, Any], schema: Dict[str, Any],
+                                stack: List[tuple]) -> None:
+    """Fill object schema, queueing nested structures onto the stack"""
+    fields = structure["fields"]
+    schema["type"] = "object"
+    properties = schema["properties"] = {}
 
-    for field_name, field_def in structure["fields"].items():
-        if isinstance(field_def, SimpleField):
-            prop_schema = _simple_field_to_json_schema(field_def)
-            properties[field_name] = prop_schema
-            if field_def.required:
-                required.append(field_name)
+    for field_name, field_def in fields.items():
+        if isinstance(field_def, _ParsedField):
+            properties[field_name] = _simple_field_to_json_schema(field_def)
         else:
             # Nested structure
-            prop_schema = _structure_to_json_schema(field_def)
-            properties[field_name] = prop_schema
-            if field_def.get('required', True):
-                required.append(field_name)
-
-    schema = {
-        "type": "object",
-        "properties": properties
-    }
+            properties[field_name] = prop_schema = {}
+            stack.append((field_def, prop_schema))
+
+    required = [
+        field_name for field_name, field_def in fields.items()
+        if (field_def.required if isinstance(field_def, _ParsedField) else field_def.get('required', True))
+    ]
     if required:
         schema["required"] = required
 
-    return schema
 
-
-def _array_structure_to_schema(structure: Dict[str, Any]) -> Dict[str, Any]:
-    """Convert array structure to JSON Schema"""
+def _array_structure_to_schema(structure: Dict[str, Any], schema: Dict[str, Any],
+                               stack: List[tuple]) -> None:
+    """Fill array schema, queueing complex item structures onto the stack"""
     items_structure = structure["items"]
     constraints = structure.get("constraints", {})
 
@@ -326,74 +473,50 @@ def _array_structure_to_schema(structure: Dict[str, Any]) -> Dict[str, Any]:
         items_schema = {"type": simple_type}
 
         # Add format for special types
-        if simple_type == "string" and original_type in ['email', 'url', 'uri', 'datetime', 'date', 'uuid']:
-            if original_type == "email":
-                items_schema["format"] = "email"
-            elif original_type in ["url", "uri"]:
-                items_schema["format"] = "uri"
-            elif original_type == "datetime":
-                items_schema["format"] = "date-time"
-            elif original_type == "date":
-                items_schema["format"] = "date"
-            elif original_type == "uuid":
-                items_schema["format"] = "uuid"
+        fmt = _FORMAT_MAP.get(original_type)
+        if fmt:
+            items_schema["format"] = fmt
 
     else:
         # Complex array: [{field1, field2}]
-        items_schema = _structure_to_json_schema(items_structure)
+        items_schema = {}
+        stack.append((items_structure, items_schema))
 
-    array_schema = {
-        "type": "array",
-        "items": items_schema
-    }
+    schema["type"] = "array"
+    schema["items"] = items_schema
 
     # Add array constraints
     if "min" in constraints:
-        array_schema["minItems"] = constraints["min"]
+        schema["minItems"] = constraints["min"]
     if "max" in constraints:
-        array_schema["maxItems"] = constraints["max"]
-
-    return array_schema
+        schema["maxItems"] = constraints["max"]
 
 
-def _simple_field_to_json_schema(field: SimpleField) -> Dict[str, Any]:
-    """Convert SimpleField to JSON Schema property with enhanced features"""
-    prop = {"type": field.field_type}
-
-    # Basic metadata
-    if field.description:
-        prop["description"] = field.description
-    if field.default is not None:
-        prop["default"] = field.default
+def _simple_field_to_json_schema(field: _ParsedField) -> Dict[str, Any]:
+    """Convert a parsed field to JSON Schema property with enhanced features"""
+    # Handle union types (parsed fields always define union_types/format_hint)
+    union_types = field.union_types
+    if union_types and len(union_types) > 1:
+        # Create anyOf for union types; the plain type and metadata don't apply
+        prop = {"anyOf": [{"type": union_type} for union_type in union_types]}
+    else:
+        prop = {"type": field.field_type}
 
-    # Handle union types
-    if hasattr(field, 'union_types') and field.union_types and len(field.union_types) > 1:
-        # Create anyOf for union types
-        union_schemas = []
-        for union_type in field.union_types:
-            if union_type == "null":
-                union_schemas.append({"type": "null"})
-            else:
-                union_schemas.append({"type": union_type})
-        prop = {"anyOf": union_schemas}
+        # Basic metadata
+        if field.description:
+            prop["description"] = field.description
+        if field.default is not None:
+            prop["default"] = field.default
 
     # Handle enum/choices
     if field.choices:
         prop["enum"] = field.choices
 
     # Add format hints for special types
-    if hasattr(field, 'format_hint') and field.format_hint:
-        if field.format_hint == "email":
-            prop["format"] = "email"
-        elif field.format_hint in ["url", "uri"]:
-            prop["format"] = "uri"
-        elif field.format_hint == "datetime":
-            prop["format"] = "date-time"
-        elif field.format_hint == "date":
-            prop["format"] = "date"
-        elif field.format_hint == "uuid":
-            prop["format"] = "uuid"
-        # Note: phone doesn't have a standard JSON Schema format
+    # Note: phone doesn't have a standard JSON Schema format
+    fmt = _FORMAT_MAP.get(field.format_hint)
+    if fmt:
+        prop["format"] = fmt
 
     # Numeric constraints
     if field.field_type in ["integer", "number"]:
@@ -414,14 +537,28 @@ def _simple_field_to_json_schema(field: SimpleField) -> Dict[str, Any]:
 
 def _split_field_definitions_with_nesting(schema_str: str) -> List[str]:
     """Split field definitions while respecting nesting"""
+    # Flat field lists have no nesting to respect, so let str.split do the scan
+    if not _NESTING_CHARS.intersection(schema_str):
+        return [part for part in (p.strip() for p in schema_str.split(',')) if part]
+
     parts = []
-    current_part = ""
+    start = 0
     bracket_depth = 0
     brace_depth = 0
     paren_depth = 0
 
-    for char in schema_str:
-        if char == '[':
+    # The regex engine skips over plain text, so the loop only sees commas and
+    # brackets; fields are sliced out at top-level commas.
+    for match in _STRUCTURAL_CHAR_RE.finditer(schema_str):
+        i = match.start()
+        char = schema_str[i]
+        if char == ',':
+            if bracket_depth == 0 and brace_depth == 0 and paren_depth == 0:
+                part = schema_str[start:i].strip()
+                if part:
+                    parts.append(part)
+                start = i + 1
+        elif char == '[':
             bracket_depth += 1
         elif char == ']':
             bracket_depth -= 1
@@ -433,101 +570,100 @@ def _split_field_definitions_with_nesting(schema_str: str) -> List[str]:
             paren_depth += 1
         elif char == ')':
             paren_depth -= 1
-        elif char == ',' and bracket_depth == 0 and brace_depth == 0 and paren_depth == 0:
-            if current_part.strip():
-                parts.append(current_part.strip())
-            current_part = ""
-            continue
-
-        current_part += char
 
-    if current_part.strip():
-        parts.append(current_part.strip())
+    part = schema_str[start:].strip()
+    if part:
+        parts.append(part)
 
     return parts
 
 
 def _normalize_string_schema(schema_str: str) -> str:
     """Normalize string schema by removing comments and extra whitespace"""
-    # Remove triple quotes
-    schema_str = re.sub(r'^[\'\"]{3}|[\'\"]{3}$', '', schema_str.strip())
+    # Remove triple quotes, then comments (whole-line and inline) in one pass
+    schema_str = _TRIPLE_QUOTE_RE.sub('', schema_str.strip())
+    schema_str = _COMMENT_RE.sub('', schema_str)
 
-    # Process line by line
-    lines = schema_str.split('\n')
-    normalized_parts = []
+    # Join non-empty lines with commas and clean up
+    return ', '.join(
+        line.rstrip(',') for line in (raw.strip() for raw in schema_str.splitlines()) if line
+    )
 
-    for line in lines:
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
 
-        # Remove inline comments
-        if ' #' in line:
-            line = line.split(' #')[0].strip()
-        elif '#' in line and not line.startswith('#'):
-            line = line.split('#')[0].strip()
+@functools.lru_cache(maxsize=256)
+def _parse_type_constraints(is_string: bool, constraint_str: str) -> Tuple[Tuple[str, Any], ...]:
+    """Parse the parenthesized constraints of a type definition.
 
-        normalized_parts.append(line)
+    Cached like _parse_kv_constraints: bodies such as 'min=1,max=100' or
+    '0,120' recur across fields, so each distinct body is parsed once.
+    """
+    constraints = []
+    constraint_parts = [part.strip() for part in constraint_str.split(',')]
+
+    # Handle positional constraints like int(0,120) -> min=0, max=120
+    if len(constraint_parts) == 2 and all('=' not in part for part in constraint_parts):
+        try:
+            min_val = float(constraint_parts[0]) if '.' in constraint_parts[0] else int(constraint_parts[0])
+            max_val = float(constraint_parts[1]) if '.' in constraint_parts[1] else int(constraint_parts[1])
+
+            if is_string:
+                constraints.append(('min_length', min_val))
+                constraints.append(('max_length', max_val))
+            else:
+                constraints.append(('min_val', min_val))
+                constraints.append(('max_val', max_val))
+        except ValueError as e:
+            logger.warning(f"Invalid positional constraints '{constraint_str}': {e}")
+    else:
+        # Handle named constraints like string(min=1,max=100)
+        for part in constraint_parts:
+            if '=' in part:
+                key, value = part.split('=', 1)
+                key = key.strip()
+                value = value.strip()
+
+                try:
+                    if key in ['min', 'max']:
+                        if is_string:
+                            constraints.append((f'{key}_length', int(value)))
+                        else:
+                            constraints.append((f'{key}_val', float(value) if '.' in value else int(value)))
+                    else:
+                        constraints.append((key, value))
+                except ValueError as e:
+                    logger.warning(f"Invalid constraint '{part}': {e}")
+            else:
+                # Single value constraint (treat as max)
+                try:
+                    if is_string:
+                        constraints.append(('max_length', int(part)))
+                    else:
+                        constraints.append(('max_val', float(part) if '.' in part else int(part)))
+                except ValueError as e:
+                    logger.warning(f"Invalid constraint value '{part}': {e}")
 
-    # Join with commas and clean up
-    result = ', '.join(part.rstrip(',') for part in normalized_parts)
-    return result
+    return tuple(constraints)
 
 
 def _parse_type_definition(type_def: str) -> tuple:
     """Parse enhanced type definitions with constraints"""
     constraints = {}
 
-    # Handle constraints in parentheses: type(min=1,max=10)
-    constraint_match = re.match(r'^(\w+)\(([^)]+)\)$', type_def)
+    if len(type_def) > _MAX_FIELD_LEN:
+        logger.warning(f"Type definition exceeds {_MAX_FIELD_LEN} characters, using defaults")
+        return "string", constraints
+
+    # Handle constraints in parentheses: type(min=1,max=10). The pattern only
+    # matches a single closing paren, so skip it when the input rules that out.
+    if '(' in type_def and type_def.count(')') == 1:
+        constraint_match = _TYPE_CONSTRAINT_RE.match(type_def)
+    else:
+        constraint_match = None
     if constraint_match:
         base_type = constraint_match.group(1)
         constraint_str = constraint_match.group(2)
 
-        # Parse constraints
-        constraint_parts = [part.strip() for part in constraint_str.split(',')]
-
-        # Handle positional constraints like int(0,120) -> min=0, max=120
-        if len(constraint_parts) == 2 and all('=' not in part for part in constraint_parts):
-            try:
-                min_val = float(constraint_parts[0]) if '.' in constraint_parts[0] else int(constraint_parts[0])
-                max_val = float(constraint_parts[1]) if '.' in constraint_parts[1] else int(constraint_parts[1])
-
-                if base_type in ['string', 'str', 'text']:
-                    constraints['min_length'] = min_val
-                    constraints['max_length'] = max_val
-                else:
-                    constraints['min_val'] = min_val
-                    constraints['max_val'] = max_val
-            except ValueError as e:
-                logger.warning(f"Invalid positional constraints '{constraint_str}': {e}")
-        else:
-            # Handle named constraints like string(min=1,max=100)
-            for part in constraint_parts:
-                if '=' in part:
-                    key, value = part.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    try:
-                        if key in ['min', 'max']:
-                            if base_type in ['string', 'str', 'text']:
-                                constraints[f'{key}_length'] = int(value)
-                            else:
-                                constraints[f'{key}_val'] = float(value) if '.' in value else int(value)
-                        else:
-                            constraints[key] = value
-                    except ValueError as e:
-                        logger.warning(f"Invalid constraint '{part}': {e}")
-                else:
-                    # Single value constraint (treat as max)
-                    try:
-                        if base_type in ['string', 'str', 'text']:
-                            constraints['max_length'] = int(part)
-                        else:
-                            constraints['max_val'] = float(part) if '.' in part else int(part)
-                    except ValueError as e:
-                        logger.warning(f"Invalid constraint value '{part}': {e}")
+        constraints = dict(_parse_type_constraints(base_type in _STRING_BASE_TYPES, constraint_str))
     else:
         base_type = type_def
 
@@ -539,34 +675,12 @@ def _parse_type_definition(type_def: str) -> tuple:
 
 def _normalize_type_name(type_name: str) -> str:
     """Normalize type names with enhanced support"""
-    type_mapping = {
-        # Basic types
-        'str': 'string',
-        'string': 'string',
-        'text': 'string',
-        'int': 'integer',
-        'integer': 'integer',
-        'num': 'number',
-        'number': 'number',
-        'float': 'number',
-        'double': 'number',
-        'decimal': 'number',
-        'bool': 'boolean',
-        'boolean': 'boolean',
-
-        # Special types (normalized to string, format handled separately)
-        'email': 'string',
-        'url': 'string',
-        'uri': 'string',
-        'datetime': 'string',
-        'date': 'string',
-        'uuid': 'string',
-        'phone': 'string',
-        'tel': 'string',
-        'null': 'null',
-    }
-
-    return type_mapping.get(type_name.lower(), 'string')
+    # Type names are almost always written in lowercase already, so try the
+    # raw token before paying for a lower() copy (mapping keys are lowercase)
+    normalized = _TYPE_MAPPING.get(type_name)
+    if normalized is None:
+        normalized = _TYPE_MAPPING.get(type_name.lower(), 'string')
+    return normalized
 
 
 # Clear function name aliases
@@ -586,6 +700,16 @@ def string_to_json_schema(schema_str: str) -> Dict[str, Any]:
     return parse_string_schema(schema_str)
 
 
+@functools.lru_cache(maxsize=512)
+def _string_to_json_schema_cached(schema_str: str) -> str:
+    """Parse once per (stripped) schema string and serialize the result"""
+    return json.dumps(_parse_string_schema(schema_str))
+
+
+parse_string_schema.cache_clear = _string_to_json_schema_cached.cache_clear
+string_to_json_schema.cache_clear = _string_to_json_schema_cached.cache_clear
+
+
 def validate_string_syntax(schema_str: str) -> Dict[str, Any]:
     """
     Validate string schema syntax and return detailed feedback.
@@ -605,6 +729,22 @@ def validate_string_syntax(schema_str: str) -> Dict[str, Any]:
 
 def validate_string_schema(schema_str: str) -> Dict[str, Any]:
     """Validate enhanced string schema with detailed feedback"""
+    # Results are cached as JSON text, so every caller gets a fresh dict
+    return json.loads(_validate_string_schema_cached(schema_str))
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_string_schema_cached(schema_str: str) -> str:
+    """Run validation once per schema string and serialize the result"""
+    return json.dumps(_validate_string_schema(schema_str))
+
+
+validate_string_schema.cache_clear = _validate_string_schema_cached.cache_clear
+validate_string_syntax.cache_clear = _validate_string_schema_cached.cache_clear
+
+
+def _validate_string_schema(schema_str: str) -> Dict[str, Any]:
+    """Validate schema string and build the feedback dictionary"""
     result = {
         'valid': False,
         'errors': [],
@@ -615,34 +755,22 @@ def validate_string_schema(schema_str: str) -> Dict[str, Any]:
     }
 
     try:
-        # Parse the schema
-        schema = parse_string_schema(schema_str)
+        # Parse the schema through the conversion cache, so validate-then-convert
+        # (or convert-then-validate) parses each string only once
+        schema = string_to_json_schema(schema_str)
         result['generated_schema'] = schema
         result['valid'] = True
 
         # Analyze features used
-        features = set()
-        if '[' in schema_str and ']' in schema_str:
-            features.add('arrays')
-        if '{' in schema_str and '}' in schema_str:
-            features.add('objects')
-        if '?' in schema_str:
-            features.add('optional_fields')
-        if 'enum(' in schema_str or 'choice(' in schema_str or 'select(' in schema_str:
-            features.add('enums')
-        if '|' in schema_str:
-            features.add('union_types')
-        if any(t in schema_str for t in ['email', 'url', 'datetime', 'date', 'uuid', 'phone']):
-            features.add('special_types')
+        tokens = set(_FEATURE_TOKEN_RE.findall(schema_str))
+        features = {_TOKEN_TO_FEATURE[token] for token in tokens}
+        # Brackets only count once both sides are present
+        if not ('[' in tokens and ']' in tokens):
+            features.discard('arrays')
+        if not ('{' in tokens and '}' in tokens):
+            features.discard('objects')
         # Check for constraints more carefully
-        constraint_patterns = [
-            r'string\([^)]+\)',  # string(min=1,max=100)
-            r'int\([^)]+\)',     # int(0,120)
-            r'number\([^)]+\)',  # number(min=0)
-            r'text\([^)]+\)',    # text(max=500)
-            r'\]\([^)]+\)'       # [string](max=5)
-        ]
-        if any(re.search(pattern, schema_str) for pattern in constraint_patterns):
+        if _CONSTRAINT_DETECT_RE.search(schema_str) is not None:
             features.add('constraints')
 
         result['features_used'] = list(features)
@@ -665,10 +793,20 @@ def validate_string_schema(schema_str: str) -> Dict[str, Any]:
 
 def _extract_field_info(schema: Dict[str, Any], fields_dict: Dict[str, Any], prefix: str = ""):
     """Extract field information from generated schema"""
-    if schema.get('type') == 'object' and 'properties' in schema:
-        required_fields = set(schema.get('required', []))
-
-        for field_name, field_schema in schema['properties'].items():
+    if schema.get('type') == 'array' and 'items' in schema:
+        schema = schema['items']
+        prefix = f"{prefix}[]" if prefix else "[]"
+        if schema.get('type') != 'object':
+            return
+
+    # Depth-first walk with an explicit stack of property iterators, so nested
+    # fields are still reported directly after their parent
+    stack = []
+    _push_properties(stack, schema, prefix)
+
+    while stack:
+        properties, required_fields, prefix = stack[-1]
+        for field_name, field_schema in properties:
             full_name = f"{prefix}.{field_name}" if prefix else field_name
 
             field_info = {
@@ -689,15 +827,20 @@ def _extract_field_info(schema: Dict[str, Any], fields_dict: Dict[str, Any], pre
 
             fields_dict[full_name] = field_info
 
-            # Recurse into nested objects
+            # Descend into nested objects before continuing with siblings
             if field_schema.get('type') == 'object':
-                _extract_field_info(field_schema, fields_dict, full_name)
+                if _push_properties(stack, field_schema, full_name):
+                    break
             elif field_schema.get('type') == 'array' and 'items' in field_schema:
-                items_schema = field_schema['items']
-                if items_schema.get('type') == 'object':
-                    _extract_field_info(items_schema, fields_dict, f"{full_name}[]")
-
-    elif schema.get('type') == 'array' and 'items' in schema:
-        items_schema = schema['items']
-        if items_schema.get('type') == 'object':
-            _extract_field_info(items_schema, fields_dict, f"{prefix}[]" if prefix else "[]")
+                if _push_properties(stack, field_schema['items'], f"{full_name}[]"):
+                    break
+        else:
+            stack.pop()
+
+
+def _push_properties(stack: List[tuple], schema: Dict[str, Any], prefix: str) -> bool:
+    """Queue an object schema's properties for _extract_field_info"""
+    if schema.get('type') == 'object' and 'properties' in schema:
+        stack.append((iter(schema['properties'].items()), set(schema.get('required', [])), prefix))
+        return True
+    return False
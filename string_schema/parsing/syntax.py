@@ -4,6 +4,7 @@ Syntax definitions and examples for String Schema string parsing
 Contains examples and documentation for the string-based schema syntax.
 """
 
+import itertools
 from typing import Dict, Any
 
 
@@ -76,17 +77,24 @@ def get_string_schema_examples() -> Dict[str, Dict[str, Any]]:
     return STRING_SCHEMA_EXAMPLES.copy()
 
 
+def _render_string_schema_examples() -> str:
+    """Render the examples listing shown by print_string_schema_examples()"""
+    lines = ["🚀 Enhanced String Schema Examples:", "=" * 60]
+    for name, example in STRING_SCHEMA_EXAMPLES.items():
+        lines.append(f"\n📝 {name.upper().replace('_', ' ')}")
+        lines.append(f"Description: {example['description']}")
+        lines.append(f"Schema: {example['schema_string']}")
+        lines.append(f"Prompt: {example['prompt_example']}")
+        lines.append("-" * 40)
+    return "\n".join(lines)
+
+
+_EXAMPLES_RENDERED = _render_string_schema_examples()
+
+
 def print_string_schema_examples():
     """Print all enhanced string schema examples with new features"""
-    print("🚀 Enhanced String Schema Examples:")
-    print("=" * 60)
-    
-    for name, example in STRING_SCHEMA_EXAMPLES.items():
-        print(f"\n📝 {name.upper().replace('_', ' ')}")
-        print(f"Description: {example['description']}")
-        print(f"Schema: {example['schema_string']}")
-        print(f"Prompt: {example['prompt_example']}")
-        print("-" * 40)
+    print(_EXAMPLES_RENDERED)
 
 
 def get_syntax_help() -> str:
@@ -188,26 +196,29 @@ def validate_syntax_example(example_name: str) -> bool:
     return all(key in example for key in required_keys)
 
 
+_SYNTAX_PATTERNS = {
+    "simple_field": "name:type",
+    "optional_field": "name:type?",
+    "constrained_field": "name:type(min=1,max=100)",
+    "enum_field": "name:enum(value1,value2,value3)",
+    "union_field": "name:type1|type2|type3",
+    "simple_array": "[type]",
+    "constrained_array": "[type](min=1,max=5)",
+    "object_array": "[{field1:type1, field2:type2}]",
+    "nested_object": "name:{field1:type1, field2:type2}",
+    "alternative_array": "name:array(type,max=5)"
+}
+
+
 def get_syntax_patterns() -> Dict[str, str]:
     """Get common syntax patterns for reference"""
-    return {
-        "simple_field": "name:type",
-        "optional_field": "name:type?",
-        "constrained_field": "name:type(min=1,max=100)",
-        "enum_field": "name:enum(value1,value2,value3)",
-        "union_field": "name:type1|type2|type3",
-        "simple_array": "[type]",
-        "constrained_array": "[type](min=1,max=5)",
-        "object_array": "[{field1:type1, field2:type2}]",
-        "nested_object": "name:{field1:type1, field2:type2}",
-        "alternative_array": "name:array(type,max=5)"
-    }
+    return _SYNTAX_PATTERNS.copy()
 
 
 # Built-in enhanced schema generators for string syntax
-def user_string_schema(include_email: bool = True, include_phone: bool = False, 
-                      include_profile: bool = False) -> str:
-    """Generate enhanced user schema string"""
+def _build_user_string_schema(include_email: bool, include_phone: bool,
+                              include_profile: bool) -> str:
+    """Build enhanced user schema string"""
     parts = ["name:string(min=1,max=100)", "age:int(min=13,max=120)"]
     
     if include_email:
@@ -221,9 +232,9 @@ def user_string_schema(include_email: bool = True, include_phone: bool = False,
     return ", ".join(parts)
 
 
-def product_string_schema(include_price: bool = True, include_description: bool = True,
-                         include_images: bool = False, include_reviews: bool = False) -> str:
-    """Generate enhanced product schema string"""
+def _build_product_string_schema(include_price: bool, include_description: bool,
+                                 include_images: bool, include_reviews: bool) -> str:
+    """Build enhanced product schema string"""
     parts = ["name:string(min=1,max=200)", "category:enum(electronics,clothing,books,home,sports)"]
     
     if include_price:
@@ -238,8 +249,8 @@ def product_string_schema(include_price: bool = True, include_description: bool
     return ", ".join(parts)
 
 
-def contact_string_schema(include_company: bool = False, include_social: bool = False) -> str:
-    """Generate enhanced contact schema string"""
+def _build_contact_string_schema(include_company: bool, include_social: bool) -> str:
+    """Build enhanced contact schema string"""
     parts = ["name:string(min=1,max=100)", "emails:[email](min=1,max=3)", "phones:[phone]?"]
     
     if include_company:
@@ -248,3 +259,34 @@ def contact_string_schema(include_company: bool = False, include_social: bool =
         parts.append("social:{linkedin:url?, twitter:url?, github:url?}?")
     
     return ", ".join(parts)
+
+
+# Every flag combination is precomputed at import; the public generators are lookups
+_USER_SCHEMA_CACHE = {
+    flags: _build_user_string_schema(*flags) for flags in itertools.product((False, True), repeat=3)
+}
+_PRODUCT_SCHEMA_CACHE = {
+    flags: _build_product_string_schema(*flags) for flags in itertools.product((False, True), repeat=4)
+}
+_CONTACT_SCHEMA_CACHE = {
+    flags: _build_contact_string_schema(*flags) for flags in itertools.product((False, True), repeat=2)
+}
+
+
+def user_string_schema(include_email: bool = True, include_phone: bool = False,
+                      include_profile: bool = False) -> str:
+    """Generate enhanced user schema string"""
+    return _USER_SCHEMA_CACHE[bool(include_email), bool(include_phone), bool(include_profile)]
+
+
+def product_string_schema(include_price: bool = True, include_description: bool = True,
+                         include_images: bool = False, include_reviews: bool = False) -> str:
+    """Generate enhanced product schema string"""
+    return _PRODUCT_SCHEMA_CACHE[
+        bool(include_price), bool(include_description), bool(include_images), bool(include_reviews)
+    ]
+
+
+def contact_string_schema(include_company: bool = False, include_social: bool = False) -> str:
+    """Generate enhanced contact schema string"""
+    return _CONTACT_SCHEMA_CACHE[bool(include_company), bool(include_social)]
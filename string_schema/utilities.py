@@ -14,22 +14,63 @@ Key Functions:
 """
 
 import functools
-import uuid
+import itertools
+import operator
 from datetime import datetime, timezone
 from typing import Any, Dict, Type, Union, Callable, Optional, List
 import logging
 
+from .parsing.string_parser import parse_string_schema, validate_string_schema
+
 # Optional pydantic import
 try:
-    from pydantic import BaseModel, ValidationError
+    from pydantic import BaseModel, ValidationError, Field, create_model as pydantic_create_model
+    from .integrations.pydantic import create_pydantic_from_json_schema, _JSON_TYPE_TO_PY
     HAS_PYDANTIC = True
 except ImportError:
     HAS_PYDANTIC = False
     BaseModel = None
     ValidationError = None
 
+# Pydantic v2 renamed .dict() to .model_dump(); pick the method once at import
+_IS_PYDANTIC_V2 = HAS_PYDANTIC and hasattr(BaseModel, 'model_dump')
+
+if _IS_PYDANTIC_V2:
+    def _dump_model(instance: BaseModel) -> Any:
+        # Same as model_dump() with default arguments, minus its keyword forwarding
+        return instance.__pydantic_serializer__.to_python(instance)
+else:
+    _dump_model = operator.methodcaller('dict')
+
+# Array models are RootModel subclasses on Pydantic v2 and __root__ models on v1
+try:
+    from pydantic import RootModel
+    HAS_ROOT_MODEL = True
+except ImportError:
+    RootModel = None
+    HAS_ROOT_MODEL = False
+
+if HAS_ROOT_MODEL:
+    def _validate_root(model: Type[BaseModel], data: Any) -> BaseModel:
+        return model(data)
+
+    def _dump_root(instance: BaseModel) -> Any:
+        return _dump_model(instance)
+else:
+    def _validate_root(model: Type[BaseModel], data: Any) -> BaseModel:
+        return model(__root__=data)
+
+    def _dump_root(instance: BaseModel) -> Any:
+        return _dump_model(instance)['__root__']
+
 logger = logging.getLogger(__name__)
 
+# Sequence numbers for anonymous models; names only need to be unique per process
+_model_counter = itertools.count()
+
+# What datetime.isoformat() appends for timezone.utc
+_UTC_OFFSET = '+00:00'
+
 
 def _ensure_timezone_aware_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -47,30 +88,64 @@ def _ensure_timezone_aware_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(data, dict):
         return data
 
-    result = {}
-    for key, value in data.items():
-        if isinstance(value, datetime):
-            # Add UTC timezone to naive datetime objects
-            if value.tzinfo is None:
-                value = value.replace(tzinfo=timezone.utc)
-            # Convert to ISO format string for consistent API responses
-            result[key] = value.isoformat()
-        elif isinstance(value, dict):
-            # Recursively process nested dictionaries
-            result[key] = _ensure_timezone_aware_dict(value)
-        elif isinstance(value, list):
-            # Process lists that may contain dictionaries or datetime objects
-            result[key] = [
-                _ensure_timezone_aware_dict(item) if isinstance(item, dict)
-                else item.isoformat() if isinstance(item, datetime) and item.tzinfo is None
-                else item.replace(tzinfo=timezone.utc).isoformat() if isinstance(item, datetime)
-                else item
-                for item in value
-            ]
-        else:
-            result[key] = value
+    return {key: _timezone_aware_value(value) for key, value in data.items()}
+
+
+def _timezone_aware_value(value: Any) -> Any:
+    """Apply _ensure_timezone_aware_dict's conversion to a single dictionary value"""
+    if isinstance(value, datetime):
+        # Convert to ISO format string for consistent API responses; naive
+        # datetimes are treated as UTC, which only appends the offset
+        if value.tzinfo is None:
+            return value.isoformat() + _UTC_OFFSET
+        return value.isoformat()
+    elif isinstance(value, dict):
+        # Recursively process nested dictionaries
+        return _ensure_timezone_aware_dict(value)
+    elif isinstance(value, list):
+        # Process lists that may contain dictionaries or datetime objects
+        return [
+            _ensure_timezone_aware_dict(item) if isinstance(item, dict)
+            else item.isoformat() if isinstance(item, datetime) and item.tzinfo is None
+            else item.replace(tzinfo=timezone.utc).isoformat() if isinstance(item, datetime)
+            else item
+            for item in value
+        ]
+    return value
+
+
+# JSON Schema types whose validated values are never datetimes, dicts or lists
+_PLAIN_JSON_TYPES = frozenset({'string', 'integer', 'number', 'boolean', 'null'})
+
+
+def _timezone_converter(object_schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Specialize _ensure_timezone_aware_dict for one object schema.
+
+    Properties that can only hold plain scalars are copied through untouched;
+    everything else gets the generic conversion.
+    """
+    properties = object_schema.get('properties')
+    if not isinstance(properties, dict):
+        return _ensure_timezone_aware_dict
+
+    plain = frozenset(
+        name for name, prop in properties.items()
+        if isinstance(prop, dict) and isinstance(prop.get('type'), str)
+        and prop['type'] in _PLAIN_JSON_TYPES and prop.get('format') != 'date-time'
+    )
+    if not plain:
+        return _ensure_timezone_aware_dict
+
+    def convert(data: Dict[str, Any]) -> Dict[str, Any]:
+        if plain.issuperset(data):
+            return data
+        result = dict(data)
+        for key in data.keys() - plain:
+            result[key] = _timezone_aware_value(result[key])
+        return result
 
-    return result
+    return convert
 
 
 def string_to_model(schema_str: str, name: Optional[str] = None) -> Type[BaseModel]:
@@ -102,120 +177,137 @@ def string_to_model(schema_str: str, name: Optional[str] = None) -> Type[BaseMod
     if not HAS_PYDANTIC:
         raise ImportError("Pydantic is required for string_to_model. Install with: pip install pydantic")
 
-    # Import here to avoid circular imports
-    from .parsing.string_parser import parse_string_schema
-    from pydantic import create_model as pydantic_create_model, Field
-    from typing import List
-
-    # Generate model name if not provided
+    # Generate model name if not provided; anonymous models are always distinct
     if name is None:
-        name = f"GeneratedModel_{str(uuid.uuid4()).replace('-', '')[:8]}"
+        name = f"GeneratedModel_{next(_model_counter)}"
+        return _build_model(schema_str, name)
 
-    try:
-        # Validate the schema string first
-        from .parsing.string_parser import validate_string_schema
-        validation_result = validate_string_schema(schema_str)
-        if not validation_result['valid']:
-            error_msg = "Invalid schema syntax"
-            if validation_result['errors']:
-                error_msg += f": {', '.join(validation_result['errors'])}"
-            raise ValueError(error_msg)
-
-        # Convert string to JSON Schema
-        json_schema = parse_string_schema(schema_str)
-
-        # Handle array schemas specially
-        if json_schema.get('type') == 'array':
-            # For array schemas, use RootModel for Pydantic v2 compatibility
-            items_schema = json_schema.get('items', {})
+    return _build_model_cached(schema_str, name)
 
-            try:
-                # Try Pydantic v2 RootModel first
-                from pydantic import RootModel
-
-                if items_schema.get('type') == 'object':
-                    # Array of objects: create nested model for items
-                    from .integrations.pydantic import create_pydantic_from_json_schema
-                    ItemModel = create_pydantic_from_json_schema(items_schema, f"{name}Item")
-
-                    # Create the array model using RootModel
-                    class ArrayModel(RootModel[List[ItemModel]]):
-                        pass
-
-                    # Set the name
-                    ArrayModel.__name__ = name
-                    return ArrayModel
-                else:
-                    # Array of simple types
-                    type_mapping = {
-                        'string': str,
-                        'integer': int,
-                        'number': float,
-                        'boolean': bool
-                    }
-                    item_type = type_mapping.get(items_schema.get('type', 'string'), str)
-
-                    # Create the array model using RootModel
-                    class ArrayModel(RootModel[List[item_type]]):
-                        pass
-
-                    # Set the name
-                    ArrayModel.__name__ = name
-                    return ArrayModel
-
-            except ImportError:
-                # Fallback to Pydantic v1 style with __root__
-                if items_schema.get('type') == 'object':
-                    # Array of objects: create nested model for items
-                    from .integrations.pydantic import create_pydantic_from_json_schema
-                    ItemModel = create_pydantic_from_json_schema(items_schema, f"{name}Item")
-
-                    # Create constraints for the array
-                    constraints = {}
-                    if 'minItems' in json_schema:
-                        constraints['min_length'] = json_schema['minItems']
-                    if 'maxItems' in json_schema:
-                        constraints['max_length'] = json_schema['maxItems']
-
-                    # Create the array model
-                    field_info = Field(**constraints) if constraints else Field()
-                    return pydantic_create_model(name, __root__=(List[ItemModel], field_info))
-                else:
-                    # Array of simple types
-                    type_mapping = {
-                        'string': str,
-                        'integer': int,
-                        'number': float,
-                        'boolean': bool
-                    }
-                    item_type = type_mapping.get(items_schema.get('type', 'string'), str)
-
-                    # Create constraints for the array
-                    constraints = {}
-                    if 'minItems' in json_schema:
-                        constraints['min_length'] = json_schema['minItems']
-                    if 'maxItems' in json_schema:
-                        constraints['max_length'] = json_schema['maxItems']
-
-                    field_info = Field(**constraints) if constraints else Field()
-                    return pydantic_create_model(name, __root__=(List[item_type], field_info))
-        else:
-            # Regular object schema
-            from .integrations.pydantic import create_pydantic_from_json_schema
-            return create_pydantic_from_json_schema(json_schema, name)
+
+def _build_model(schema_str: str, name: str) -> Type[BaseModel]:
+    """Build a Pydantic model class from a string schema"""
+    try:
+        # A schema is valid exactly when it parses, so parse once and skip the
+        # feature analysis validate_string_schema would add
+        try:
+            json_schema = parse_string_schema(schema_str)
+        except Exception as e:
+            raise ValueError(f"Invalid schema syntax: {e}") from e
+        model = _model_from_json_schema(json_schema, name)
+
+        # Record the schema shape on the class so validation never re-inspects it
+        model.__string_schema_json__ = json_schema
+        model.__string_schema_is_array__ = json_schema.get('type') == 'array'
+        model.__string_schema_to_dict__ = _timezone_converter(
+            json_schema.get('items', {}) if model.__string_schema_is_array__ else json_schema
+        )
+        return model
 
     except Exception as e:
         raise ValueError(f"Failed to create model from schema '{schema_str}': {str(e)}") from e
 
 
+def _model_from_json_schema(json_schema: Dict[str, Any], name: str) -> Type[BaseModel]:
+    """Create the model class for a JSON Schema generated from a string schema"""
+    # Handle array schemas specially
+    if json_schema.get('type') == 'array':
+        items_schema = json_schema.get('items', {})
+
+        if items_schema.get('type') == 'object':
+            # Array of objects: create nested model for items
+            item_type = create_pydantic_from_json_schema(items_schema, f"{name}Item")
+        else:
+            # Array of simple types
+            item_type = _JSON_TYPE_TO_PY.get(items_schema.get('type', 'string'), str)
+
+        if HAS_ROOT_MODEL:
+            # Pydantic v2: create the array model using RootModel
+            class ArrayModel(RootModel[List[item_type]]):
+                pass
+
+            # Set the name
+            ArrayModel.__name__ = name
+            return ArrayModel
+
+        # Fallback to Pydantic v1 style with __root__
+        constraints = {}
+        if 'minItems' in json_schema:
+            constraints['min_length'] = json_schema['minItems']
+        if 'maxItems' in json_schema:
+            constraints['max_length'] = json_schema['maxItems']
+
+        field_info = Field(**constraints) if constraints else Field()
+        return pydantic_create_model(name, __root__=(List[item_type], field_info))
+    else:
+        # Regular object schema
+        return create_pydantic_from_json_schema(json_schema, name)
+
+
+# Named models are reused: validate_to_dict/validate_to_model and the decorators
+# hit the same (schema_str, name) pair on every call
+_build_model_lru = functools.lru_cache(maxsize=1024)(_build_model)
+
+
+def _build_model_cached(schema_str: str, name: str) -> Type[BaseModel]:
+    """Return the cached model for a schema, ignoring surrounding whitespace"""
+    return _build_model_lru(schema_str.strip(), name)
+
+
 # Legacy alias for backward compatibility
-def create_model(schema_str: str, name: Optional[str] = None) -> Type[BaseModel]:
+# DEPRECATED: Use string_to_model() instead for consistent naming.
+create_model = string_to_model
+
+
+def _validate_object(model: Type[BaseModel], data: Any) -> BaseModel:
+    """Validate data against an object model"""
+    # Handle different input types for object schemas
+    if isinstance(data, dict):
+        return model(**data)
+    elif hasattr(data, '__dict__'):
+        # Handle objects with attributes
+        return model(**data.__dict__)
+    else:
+        # Try direct validation
+        return model(data)
+
+
+def _object_to_dict(model: Type[BaseModel], data: Any) -> Dict[str, Any]:
+    """Validate data against an object model and return a timezone-aware dict"""
+    result_dict = _dump_model(_validate_object(model, data))
+    # Ensure timezone-aware datetime conversion for consistent API responses
+    return model.__string_schema_to_dict__(result_dict)
+
+
+def _array_to_dict(model: Type[BaseModel], data: Any) -> Any:
+    """Validate data against an array model and return the validated items"""
+    result_data = _dump_root(_validate_root(model, data))
+    # Process array items for timezone-aware datetime conversion
+    if isinstance(result_data, list):
+        convert = model.__string_schema_to_dict__
+        return [convert(item) if isinstance(item, dict) else item for item in result_data]
+    return result_data
+
+
+def _bind_validator(schema_str: str, to_dict: bool) -> Optional[Callable[[Any], Any]]:
     """
-    Create Pydantic model from string schema.
+    Resolve a schema's model once and bind the matching validation routine.
 
-    DEPRECATED: Use string_to_model() instead for consistent naming.
+    Returns None if the model cannot be built, leaving the error to surface
+    through validate_to_dict/validate_to_model when the wrapped function runs.
     """
-    return string_to_model(schema_str, name)
+    if not HAS_PYDANTIC:
+        return None
+    try:
+        model = _build_model_cached(schema_str, "TempValidationModel")
+    except ValueError:
+        return None
+
+    if model.__string_schema_is_array__:
+        validate = _array_to_dict if to_dict else _validate_root
+    else:
+        validate = _object_to_dict if to_dict else _validate_object
+    return functools.partial(validate, model)
 
 
 def validate_to_dict(data: Union[Dict[str, Any], Any], schema_str: str) -> Union[Dict[str, Any], List[Any]]:
@@ -248,53 +340,13 @@ def validate_to_dict(data: Union[Dict[str, Any], Any], schema_str: str) -> Union
         raise ImportError("Pydantic is required for validate_to_dict. Install with: pip install pydantic")
 
     try:
-        # Create temporary model for validation
-        TempModel = string_to_model(schema_str, "TempValidationModel")
-
-        # Check if this is an array schema
-        from .parsing.string_parser import parse_string_schema
-        json_schema = parse_string_schema(schema_str)
-        is_array_schema = json_schema.get('type') == 'array'
+        # Create temporary model for validation (cached per schema string)
+        TempModel = _build_model_cached(schema_str, "TempValidationModel")
+        is_array_schema = TempModel.__string_schema_is_array__
 
         if is_array_schema:
-            # For array schemas, validate the data directly
-            try:
-                # Try Pydantic v2 RootModel style
-                validated_instance = TempModel(data)
-                # Return the validated array data with timezone-aware conversion
-                result_data = validated_instance.model_dump() if hasattr(validated_instance, 'model_dump') else validated_instance.dict()
-                # Process array items for timezone-aware datetime conversion
-                if isinstance(result_data, list):
-                    return [_ensure_timezone_aware_dict(item) if isinstance(item, dict) else item for item in result_data]
-                return result_data
-            except:
-                # Fallback to Pydantic v1 style
-                validated_instance = TempModel(__root__=data)
-                # Return the validated array data with timezone-aware conversion
-                result_data = validated_instance.model_dump()['__root__'] if hasattr(validated_instance, 'model_dump') else validated_instance.dict()['__root__']
-                # Process array items for timezone-aware datetime conversion
-                if isinstance(result_data, list):
-                    return [_ensure_timezone_aware_dict(item) if isinstance(item, dict) else item for item in result_data]
-                return result_data
-        else:
-            # Handle different input types for object schemas
-            if isinstance(data, dict):
-                validated_instance = TempModel(**data)
-            elif hasattr(data, '__dict__'):
-                # Handle objects with attributes
-                validated_instance = TempModel(**data.__dict__)
-            else:
-                # Try direct validation
-                validated_instance = TempModel(data)
-
-            # Return as dictionary with timezone-aware datetime handling
-            if hasattr(validated_instance, 'model_dump'):
-                result_dict = validated_instance.model_dump()
-            else:
-                result_dict = validated_instance.dict()
-
-            # Ensure timezone-aware datetime conversion for consistent API responses
-            return _ensure_timezone_aware_dict(result_dict)
+            return _array_to_dict(TempModel, data)
+        return _object_to_dict(TempModel, data)
 
     except ValidationError as e:
         # Re-raise the original validation error
@@ -335,32 +387,13 @@ def validate_to_model(data: Union[Dict[str, Any], Any], schema_str: str):
         raise ImportError("Pydantic is required for validate_to_model. Install with: pip install pydantic")
 
     try:
-        # Create temporary model for validation
-        TempModel = string_to_model(schema_str, "TempValidationModel")
-
-        # Check if this is an array schema
-        from .parsing.string_parser import parse_string_schema
-        json_schema = parse_string_schema(schema_str)
-        is_array_schema = json_schema.get('type') == 'array'
+        # Create temporary model for validation (cached per schema string)
+        TempModel = _build_model_cached(schema_str, "TempValidationModel")
+        is_array_schema = TempModel.__string_schema_is_array__
 
         if is_array_schema:
-            # For array schemas, validate the data directly
-            try:
-                # Try Pydantic v2 RootModel style
-                return TempModel(data)
-            except:
-                # Fallback to Pydantic v1 style
-                return TempModel(__root__=data)
-        else:
-            # Handle different input types for object schemas
-            if isinstance(data, dict):
-                return TempModel(**data)
-            elif hasattr(data, '__dict__'):
-                # Handle objects with attributes
-                return TempModel(**data.__dict__)
-            else:
-                # Try direct validation
-                return TempModel(data)
+            return _validate_root(TempModel, data)
+        return _validate_object(TempModel, data)
 
     except ValidationError as e:
         # Re-raise the original validation error
@@ -395,12 +428,15 @@ def returns_dict(schema_str: str) -> Callable:
             # Transform and validate events
             return transformed_events  # Returns list of validated dicts
     """
+    # Resolve the model once; fall back to per-call validation if it cannot be built
+    validate = _bind_validator(schema_str, to_dict=True) or (lambda result: validate_to_dict(result, schema_str))
+
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
             try:
-                return validate_to_dict(result, schema_str)
+                return validate(result)
             except Exception as e:
                 raise ValueError(f"Function '{func.__name__}' returned invalid data for schema '{schema_str}': {str(e)}") from e
         return wrapper
@@ -433,12 +469,15 @@ def returns_model(schema_str: str) -> Callable:
             # ML processing logic
             return processed_result  # Returns validated model with type safety
     """
+    # Resolve the model once; fall back to per-call validation if it cannot be built
+    validate = _bind_validator(schema_str, to_dict=False) or (lambda result: validate_to_model(result, schema_str))
+
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
             try:
-                return validate_to_model(result, schema_str)
+                return validate(result)
             except Exception as e:
                 raise ValueError(f"Function '{func.__name__}' returned invalid data for schema '{schema_str}': {str(e)}") from e
         return wrapper
@@ -447,6 +486,55 @@ def returns_model(schema_str: str) -> Callable:
 
 # Utility functions for enhanced error handling and debugging
 
+# Constraint attributes on Pydantic v2 field metadata and their reported names
+_CONSTRAINT_ATTRS = (
+    ('ge', 'min_value'),
+    ('le', 'max_value'),
+    ('min_length', 'min_length'),
+    ('max_length', 'max_length'),
+)
+
+
+def _field_info_v2(field_info) -> Dict[str, Any]:
+    """Describe a Pydantic v2 FieldInfo"""
+    default = field_info.default
+    constraints = {}
+    for constraint in field_info.metadata:
+        for attr, key in _CONSTRAINT_ATTRS:
+            value = getattr(constraint, attr, None)
+            if value is not None:
+                constraints[key] = value
+
+    return {
+        "type": str(field_info.annotation),
+        "required": field_info.is_required(),
+        "default": default if default is not ... else None,
+        "constraints": constraints
+    }
+
+
+def _field_info_v1(field_info) -> Dict[str, Any]:
+    """Describe a Pydantic v1 ModelField"""
+    try:
+        field_type = str(field_info.type_)
+        required = field_info.required
+        default = field_info.default
+    except AttributeError:
+        field_type = str(getattr(field_info, 'type_', 'unknown'))
+        required = getattr(field_info, 'required', True)
+        default = getattr(field_info, 'default', None)
+
+    return {
+        "type": field_type,
+        "required": required,
+        "default": default if default is not ... else None,
+        "constraints": {}
+    }
+
+
+_field_info = _field_info_v2 if _IS_PYDANTIC_V2 else _field_info_v1
+
+
 def get_model_info(model_class) -> Dict[str, Any]:
     """
     Get detailed information about a generated Pydantic model.
@@ -457,64 +545,28 @@ def get_model_info(model_class) -> Dict[str, Any]:
     Returns:
         Dictionary with model information including fields, types, and constraints
     """
-    if not HAS_PYDANTIC or not issubclass(model_class, BaseModel):
+    if not HAS_PYDANTIC or not isinstance(model_class, type) or not issubclass(model_class, BaseModel):
         raise ValueError("Input must be a Pydantic model class")
 
+    fields = {}
+    required_fields = []
+    optional_fields = []
     info = {
         "model_name": model_class.__name__,
-        "fields": {},
-        "required_fields": [],
-        "optional_fields": []
+        "fields": fields,
+        "required_fields": required_fields,
+        "optional_fields": optional_fields
     }
 
-    # Handle both Pydantic v1 and v2
-    if hasattr(model_class, 'model_fields'):
-        # Pydantic v2
-        fields_dict = model_class.model_fields
-        for field_name, field_info in fields_dict.items():
-            field_data = {
-                "type": str(field_info.annotation) if hasattr(field_info, 'annotation') else "unknown",
-                "required": field_info.is_required() if hasattr(field_info, 'is_required') else True,
-                "default": field_info.default if hasattr(field_info, 'default') and field_info.default is not ... else None,
-                "constraints": {}
-            }
-
-            # Extract constraints from field_info
-            if hasattr(field_info, 'constraints'):
-                constraints = field_info.constraints
-                for constraint in constraints:
-                    if hasattr(constraint, 'ge') and constraint.ge is not None:
-                        field_data["constraints"]["min_value"] = constraint.ge
-                    if hasattr(constraint, 'le') and constraint.le is not None:
-                        field_data["constraints"]["max_value"] = constraint.le
-                    if hasattr(constraint, 'min_length') and constraint.min_length is not None:
-                        field_data["constraints"]["min_length"] = constraint.min_length
-                    if hasattr(constraint, 'max_length') and constraint.max_length is not None:
-                        field_data["constraints"]["max_length"] = constraint.max_length
-
-            info["fields"][field_name] = field_data
-
-            if field_data["required"]:
-                info["required_fields"].append(field_name)
-            else:
-                info["optional_fields"].append(field_name)
-    else:
-        # Pydantic v1 fallback
-        fields_dict = getattr(model_class, '__fields__', {})
-        for field_name, field_info in fields_dict.items():
-            field_data = {
-                "type": str(getattr(field_info, 'type_', 'unknown')),
-                "required": getattr(field_info, 'required', True),
-                "default": getattr(field_info, 'default', None) if getattr(field_info, 'default', ...) is not ... else None,
-                "constraints": {}
-            }
-
-            info["fields"][field_name] = field_data
-
-            if field_data["required"]:
-                info["required_fields"].append(field_name)
-            else:
-                info["optional_fields"].append(field_name)
+    fields_dict = model_class.model_fields if _IS_PYDANTIC_V2 else getattr(model_class, '__fields__', {})
+    for field_name, field_info in fields_dict.items():
+        field_data = _field_info(field_info)
+        fields[field_name] = field_data
+
+        if field_data["required"]:
+            required_fields.append(field_name)
+        else:
+            optional_fields.append(field_name)
 
     return info
 
@@ -529,8 +581,6 @@ def validate_schema_compatibility(schema_str: str) -> Dict[str, Any]:
     Returns:
         Dictionary with compatibility information and any warnings
     """
-    from .parsing.string_parser import validate_string_schema
-    
     result = validate_string_schema(schema_str)
     
     # Add Pydantic-specific compatibility checks
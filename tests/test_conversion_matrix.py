@@ -142,6 +142,25 @@ class TestReverseConversions:
         assert "name:string" in result_str
         assert "email:email" in result_str or "email:string" in result_str
         assert "age:" in result_str
+
+    def test_json_schema_to_string_tracks_input_changes(self):
+        """Test repeated conversions follow field order and later edits of the input"""
+        json_schema = {
+            "type": "object",
+            "properties": {"a": {"type": "string"}, "b": {"type": "integer"}},
+            "required": ["a", "b"]
+        }
+        reordered = {
+            "type": "object",
+            "properties": {"b": {"type": "integer"}, "a": {"type": "string"}},
+            "required": ["a", "b"]
+        }
+
+        assert json_schema_to_string(json_schema) == "{a:string, b:int}"
+        assert json_schema_to_string(reordered) == "{b:int, a:string}"
+
+        json_schema["required"].remove("b")
+        assert json_schema_to_string(json_schema) == "{a:string, b:int?}"
     
     def test_openapi_to_string(self):
         """Test OpenAPI schema to string conversion"""
@@ -183,6 +202,20 @@ class TestReverseConversions:
         # OpenAPI-specific fields should be removed
         assert 'example' not in json_schema
 
+    def test_openapi_to_json_schema_leaves_input_untouched(self):
+        """Test OpenAPI keywords are stripped from a copy, including nested properties"""
+        openapi_schema = {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "example": "John", "xml": {"name": "n"}}
+            }
+        }
+
+        json_schema = openapi_to_json_schema(openapi_schema)
+
+        assert json_schema["properties"]["name"] == {"type": "string"}
+        assert openapi_schema["properties"]["name"]["example"] == "John"
+
 
 class TestRoundTripConversions:
     """Test round-trip conversions to ensure data integrity"""
@@ -400,6 +433,24 @@ class TestEdgeCases:
                 # Errors are acceptable for malformed schemas
                 pass
 
+    def test_very_deep_json_schema_to_string(self):
+        """Test reverse conversion of nesting deeper than the recursion limit"""
+        json_schema = {"type": "string"}
+        for _ in range(5000):
+            json_schema = {"type": "object", "properties": {"child": json_schema}, "required": ["child"]}
+
+        assert json_schema_to_string(json_schema) == "{child:string}"
+
+    def test_self_referencing_openapi_schema(self):
+        """Test OpenAPI conversion of a schema object that contains itself"""
+        node = {"type": "object", "properties": {"name": {"type": "string", "example": "x"}}}
+        node["properties"]["parent"] = node
+
+        json_schema = openapi_to_json_schema(node)
+        assert json_schema["properties"]["parent"] is json_schema
+        assert json_schema["properties"]["name"] == {"type": "string"}
+        assert openapi_to_string(node) == "{name:string?, parent:string?}"
+
     def test_circular_reference_prevention(self):
         """Test prevention of circular references in schemas"""
         # Create a schema that could potentially cause circular references
@@ -886,11 +937,14 @@ class TestDataIntegrityAndConsistency:
             'url_field': 'url',
         }
 
+        # Split the emitted object once instead of substring-searching per type
+        emitted = dict(part.split(':', 1) for part in result.strip('{}').split(', '))
+
         for field, expected_types in type_mappings.items():
             if isinstance(expected_types, tuple):
-                assert any(f"{field}:{t}" in result for t in expected_types)
+                assert emitted[field] in expected_types
             else:
-                assert f"{field}:{expected_types}" in result or f"{field}:" in result
+                assert field in emitted
 
 
 if __name__ == '__main__':
@@ -68,6 +68,14 @@ class TestSimpleField:
         assert field.max_length == 100
         assert field.required == True
 
+    def test_field_accepts_extra_attributes(self):
+        """Test that fields keep an instance __dict__ for user attributes"""
+        field = SimpleField('string', 'Test field')
+        field.ui_label = 'Name'
+
+        assert vars(field)['ui_label'] == 'Name'
+        assert vars(field)['description'] == 'Test field'
+
 
 class TestSchemaBuilders:
     """Test schema building functions"""
@@ -107,6 +115,8 @@ class TestSchemaBuilders:
         
         assert schema['type'] == 'object'
         assert len(schema['properties']) == 2
+        assert schema['properties']['age'] == {'type': 'integer'}
+        assert schema['required'] == ['name', 'age']
     
     def test_list_of_objects_schema(self):
         """Test creating array schema"""
@@ -183,6 +193,16 @@ class TestValidators:
         
         assert result['valid'] == False
         assert len(result['errors']) > 0
+    
+    def test_validate_schema_tracks_input_changes(self):
+        """Test repeated validation returns fresh results that follow the input"""
+        schema = {'type': 'object', 'properties': {'name': {'type': 'string'}}}
+        first = validate_schema(schema)
+        first['errors'].append('mutated')
+        assert validate_schema(schema)['errors'] == []
+        
+        schema['required'] = ['missing']
+        assert validate_schema(schema)['valid'] == False
 
 
 if __name__ == '__main__':
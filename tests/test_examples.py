@@ -108,6 +108,16 @@ class TestPresetSchemas:
         assert 'status' in schema['properties']
         assert 'enum' in schema['properties']['status']
     
+    def test_preset_results_are_independent(self):
+        """Test that editing one preset result does not leak into the next"""
+        schema = event_schema()
+        schema['properties']['status']['enum'].append('postponed')
+        schema['properties']['title']['maxLength'] = 10
+        
+        fresh = event_schema()
+        assert fresh['properties']['status']['enum'] == ['planned', 'active', 'completed', 'cancelled']
+        assert fresh['properties']['title']['maxLength'] == 200
+    
     def test_get_examples(self):
         """Test getting all examples"""
         examples = get_examples()
@@ -241,9 +251,9 @@ class TestSchemaValidation:
             event_schema(include_location=True, include_attendees=True)
         ]
         
-        for schema in schemas_to_test:
-            result = validate_schema(schema)
-            assert result['valid'] == True, f"Schema validation failed: {result['errors']}"
+        failures = [result['errors'] for result in map(validate_schema, schemas_to_test)
+                    if not result['valid']]
+        assert not failures, f"Schema validation failed: {failures}"
     
     def test_all_recipe_schemas_valid(self):
         """Test that all recipe schemas are valid"""
@@ -266,9 +276,9 @@ class TestSchemaValidation:
             create_blog_post_schema()
         ]
         
-        for schema in schemas_to_test:
-            result = validate_schema(schema)
-            assert result['valid'] == True, f"Schema validation failed: {result['errors']}"
+        failures = [result['errors'] for result in map(validate_schema, schemas_to_test)
+                    if not result['valid']]
+        assert not failures, f"Schema validation failed: {failures}"
 
 
 if __name__ == '__main__':
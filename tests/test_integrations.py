@@ -21,7 +21,8 @@ from string_schema.integrations.json_schema import (
     to_json_schema,
     to_json_schema_with_examples,
     validate_json_schema_compliance,
-    optimize_json_schema
+    optimize_json_schema,
+    convert_to_openapi_schema
 )
 from string_schema.integrations.openapi import (
     to_openapi_schema,
@@ -92,6 +93,33 @@ class TestPydanticIntegration:
         # Test constraint validation would require actual Pydantic validation
         # which depends on the specific Pydantic version and setup
 
+    @pytest.mark.skipif(not HAS_PYDANTIC, reason="Pydantic not available")
+    def test_create_pydantic_model_reuses_identical_definitions(self):
+        """Test that identical field definitions share one model class"""
+        first = create_pydantic_model('CachedModel', {'name': SimpleField('string', min_length=1)})
+        second = create_pydantic_model('CachedModel', {'name': SimpleField('string', min_length=1)})
+        changed = create_pydantic_model('CachedModel', {'name': SimpleField('string', min_length=2)})
+
+        assert first is second
+        assert changed is not first
+        with pytest.raises(Exception):
+            changed(name="a")
+
+    @pytest.mark.skipif(not HAS_PYDANTIC, reason="Pydantic not available")
+    def test_create_pydantic_model_cache_distinguishes_value_types(self):
+        """Test that equal-comparing values of different types build separate models"""
+        models = [
+            create_pydantic_model('TypedDefault', {'x': SimpleField('integer', default=value, required=False)})
+            for value in (True, 1, 1.0)
+        ]
+
+        assert len({id(model) for model in models}) == 3
+        assert [type(model().x) for model in models] == [bool, int, float]
+
+        capped_int = create_pydantic_model('TypedMax', {'x': SimpleField('number', max_val=1)})
+        capped_float = create_pydantic_model('TypedMax', {'x': SimpleField('number', max_val=1.0)})
+        assert capped_int is not capped_float
+
     def test_validate_pydantic_compatibility(self):
         """Test validating Pydantic compatibility"""
         fields = {
@@ -106,6 +134,19 @@ class TestPydanticIntegration:
         assert result['compatible'] == True
         assert len(result['warnings']) > 0  # Should warn about complex union
 
+    def test_validate_pydantic_compatibility_fail_fast(self):
+        """Test stopping at the first incompatible field"""
+        fields = {
+            'low': SimpleField('integer', min_val=10, max_val=1),
+            'short': SimpleField('string', min_length=5, max_length=2)
+        }
+
+        assert len(validate_pydantic_compatibility(fields)['errors']) == 2
+
+        result = validate_pydantic_compatibility(fields, fail_fast=True)
+        assert result['compatible'] == False
+        assert result['errors'] == ["Field 'low' has min_val > max_val"]
+
     def test_generate_pydantic_code(self):
         """Test generating Pydantic model code"""
         fields = {
@@ -222,6 +263,20 @@ class TestOpenAPIIntegration:
         # Should not have JSON Schema specific fields
         assert '$schema' not in schema
     
+    def test_convert_to_openapi_schema_copy_flag(self):
+        """Test that only copy=False converts the given schema in place"""
+        json_schema = to_json_schema({'name': SimpleField('string', 'Name field')})
+        
+        copied = convert_to_openapi_schema(json_schema)
+        assert copied is not json_schema
+        assert '$schema' in json_schema
+        assert '$schema' not in copied
+        
+        converted = convert_to_openapi_schema(json_schema, copy=False)
+        assert converted is json_schema
+        assert '$schema' not in json_schema
+        assert converted['properties'] == copied['properties']
+    
     def test_create_openapi_component(self):
         """Test creating OpenAPI component"""
         fields = {
@@ -2,13 +2,18 @@
 Tests for string parsing functionality
 """
 
+import json
+
 import pytest
 from string_schema.parsing.string_parser import (
     parse_string_schema,
+    string_to_json_schema,
     validate_string_schema,
     _normalize_type_name,
-    _parse_enum_values
+    _parse_enum_values,
+    _split_field_definitions_with_nesting
 )
+from string_schema.parsing.syntax import get_string_schema_examples, get_syntax_patterns
 
 
 class TestStringParsing:
@@ -107,6 +112,20 @@ class TestStringParsing:
         assert 'user' in schema['properties']
         # Note: Full nested object support would require more complex implementation
 
+    def test_string_to_json_schema_results_are_independent(self):
+        """Test that repeated conversions return fresh, unshared schemas"""
+        schema_str = "name:string, tags:[string](max=5)"
+        first = string_to_json_schema(schema_str)
+        first['properties'].clear()
+
+        second = string_to_json_schema("  " + schema_str)
+        assert second == parse_string_schema(schema_str)
+        assert 'tags' in second['properties']
+
+        parsed = parse_string_schema(schema_str)
+        parsed['required'].append('extra')
+        assert parse_string_schema(schema_str)['required'] == ['name', 'tags']
+
 
 class TestStringValidation:
     """Test string schema validation"""
@@ -144,6 +163,25 @@ class TestStringValidation:
         assert result['valid'] == True
         assert 'union_types' in result['features_used']
     
+    def test_validate_malformed_union_schema(self):
+        """Test that unions with empty or non-identifier members are rejected"""
+        for schema_str in ["id:string|", "id:|int", "id:string|int(0,5)"]:
+            result = validate_string_schema(schema_str)
+            
+            assert result['valid'] == False
+            assert any('union' in error for error in result['errors'])
+    
+    def test_validate_results_are_independent(self):
+        """Test that repeated validation returns fresh, unshared results"""
+        schema_str = "name:string, tags:[string](max=5)"
+        first = validate_string_schema(schema_str)
+        first['errors'].append('mutated')
+        first['generated_schema']['properties'].clear()
+        
+        second = validate_string_schema(schema_str)
+        assert second['errors'] == []
+        assert 'tags' in second['generated_schema']['properties']
+    
     def test_validate_invalid_schema(self):
         """Test validating invalid schema"""
         # This would depend on what makes a schema invalid in our implementation
@@ -177,6 +215,33 @@ class TestUtilityFunctions:
         
         values = _parse_enum_values('select(a,b,c)')
         assert values == ['a', 'b', 'c']
+        
+        # Whitespace is stripped; empty entries are kept in place
+        values = _parse_enum_values('enum( a , b,,c ,)')
+        assert values == ['a', 'b', '', 'c', '']
+        values.append('mutated')
+        assert _parse_enum_values('enum( a , b,,c ,)') == ['a', 'b', '', 'c', '']
+    
+    def test_split_field_definitions_with_nesting(self):
+        """Test splitting only on top-level commas"""
+        parts = _split_field_definitions_with_nesting(
+            "name:string(min=1,max=5), tags:[string](max=5), user:{a, b}, ,café:int"
+        )
+        assert parts == ['name:string(min=1,max=5)', 'tags:[string](max=5)', 'user:{a, b}', 'café:int']
+
+    def test_get_string_schema_examples(self):
+        """Test examples and patterns are returned as independent plain dicts"""
+        examples = get_string_schema_examples()
+        assert "simple_arrays" in examples
+        assert json.loads(json.dumps(examples)) == examples
+
+        examples["custom"] = {}
+        assert "custom" not in get_string_schema_examples()
+
+        patterns = get_syntax_patterns()
+        assert isinstance(patterns, dict)
+        patterns["custom"] = "name:custom"
+        assert "custom" not in get_syntax_patterns()
 
 
 class TestComplexSchemas:
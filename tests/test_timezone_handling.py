@@ -178,14 +178,17 @@ def test_performance_impact_minimal():
         for i in range(100)  # 100 items
     ]
     
+    schema = "[{id:int, name:string, timestamp:datetime}]"
+    # Warm the parse and model caches so only validation is timed
+    validate_to_dict(test_data[:1], schema)
+    
     # Measure validation time
-    start_time = time.time()
-    result = validate_to_dict(test_data, "[{id:int, name:string, timestamp:datetime}]")
-    end_time = time.time()
+    start_time = time.perf_counter_ns()
+    result = validate_to_dict(test_data, schema)
+    ns_per_item = (time.perf_counter_ns() - start_time) / len(test_data)
     
-    # Should complete quickly (under 1 second for 100 items)
-    processing_time = end_time - start_time
-    assert processing_time < 1.0, f"Processing took too long: {processing_time:.3f}s"
+    # Should complete quickly (under 200 microseconds per item once warm)
+    assert ns_per_item < 200_000, f"Processing took too long: {ns_per_item:.0f} ns/item"
     
     # Should process all items correctly
     assert len(result) == 100
@@ -118,6 +118,39 @@ class TestStringToModel:
         assert Model1.__name__ != Model2.__name__
         assert "GeneratedModel_" in Model1.__name__
 
+    def test_named_model_is_reused(self):
+        """Test that named models are built once per schema and name"""
+        Model1 = string_to_model("name:string, age:int?", name="CachedUser")
+        Model2 = string_to_model("name:string, age:int?", name="CachedUser")
+        Model3 = string_to_model("  name:string, age:int?\n", name="CachedUser")
+        Other = string_to_model("name:string, age:int?", name="OtherUser")
+
+        assert Model1 is Model2
+        assert Model3 is Model1
+        assert Other is not Model1
+        assert Other.__name__ == "OtherUser"
+
+    def test_model_build_is_deferred_until_use(self):
+        """Test that object models build their validator on first use"""
+        UserModel = string_to_model("name:string, age:int?")
+
+        assert UserModel.__pydantic_complete__ is False
+        assert set(UserModel.model_fields) == {"name", "age"}
+
+        user = UserModel(name="Alice", age=30)
+        assert user.age == 30
+        assert UserModel.__pydantic_complete__ is True
+
+    def test_model_records_schema_shape(self):
+        """Test that generated models carry their JSON Schema and array flag"""
+        ArrayModel = string_to_model("[{name:string}]")
+        ObjectModel = string_to_model("name:string")
+
+        assert ArrayModel.__string_schema_is_array__ is True
+        assert ArrayModel.__string_schema_json__['type'] == 'array'
+        assert ObjectModel.__string_schema_is_array__ is False
+        assert ObjectModel.__string_schema_json__['type'] == 'object'
+
     def test_custom_model_name(self):
         """Test custom model name"""
         CustomModel = string_to_model("name:string", name="CustomUser")
@@ -186,6 +219,24 @@ class TestValidationFunctions:
         assert len(result) == 2
         assert result[0]["name"] == "Product1"
     
+    def test_validate_to_dict_converts_only_datetime_fields(self):
+        """Test that datetimes, including nested ones, come back as UTC ISO strings"""
+        data = {
+            "id": 1,
+            "created": datetime(2024, 1, 1, 12, 0),
+            "meta": {"seen": datetime(2024, 1, 2)},
+            "events": [{"at": "2024-01-03T00:00:00"}]
+        }
+        schema = "id:int, created:datetime, meta:{seen:datetime}, events:[{at:datetime}]"
+        
+        result = validate_to_dict(data, schema)
+        assert result == {
+            "id": 1,
+            "created": "2024-01-01T12:00:00+00:00",
+            "meta": {"seen": "2024-01-02T00:00:00+00:00"},
+            "events": [{"at": "2024-01-03T00:00:00+00:00"}]
+        }
+    
     def test_validate_object_with_attributes(self):
         """Test validation of objects with attributes"""
         class SimpleObject:
@@ -327,6 +378,14 @@ class TestUtilityFunctions:
         assert "special_types" in compatibility["features_used"]
         assert isinstance(compatibility["recommendations"], list)
     
+    def test_get_model_info_constraints(self):
+        """Test get_model_info() reports field constraints"""
+        Model = string_to_model("name:string(min=1,max=50), age:int(0,120)?")
+        info = get_model_info(Model)
+
+        assert info["fields"]["name"]["constraints"] == {"min_length": 1, "max_length": 50}
+        assert info["fields"]["age"]["constraints"] == {"min_value": 0, "max_value": 120}
+
     def test_get_model_info_invalid_input(self):
         """Test get_model_info() with invalid input"""
         with pytest.raises(ValueError):